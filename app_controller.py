@@ -112,13 +112,25 @@ class WeatherAppController:
         
         # Bind events after custom handlers are set up
         self.event_handlers.bind_events()
+        
+        # Feature tabs are built on first selection; wire them up as they appear
+        self.gui_components.on_tab_built = self._on_tab_built
+    
+    def _on_tab_built(self, tab_name):
+        """Hand a newly built tab's widgets to the event handlers"""
+        self.event_handlers.set_widgets(self.widgets)
+        self.event_handlers.bind_events()
+        
+        # Load history the first time the history tab is shown
+        if tab_name == "Weather History":
+            self.event_handlers.handle_load_recent_history()
     
     def _setup_custom_event_handlers(self):
         """Setup custom event handlers that require controller access"""
         # Theme toggle handler
         def handle_theme_toggle():
             # Get new theme state from switch
-            is_dark = self.widgets['theme_switch'].get()
+            is_dark = self.widgets.theme_switch.get()
             new_theme = 'dark' if is_dark else 'light'
             
             # Apply theme
@@ -126,21 +138,21 @@ class WeatherAppController:
             self.preferences_manager.update_preference('theme', new_theme)
             
             # Update status
-            self.widgets['status_label'].configure(text=f"Switched to {new_theme} mode")
+            self.widgets.status_label.configure(text=f"Switched to {new_theme} mode")
         
         # Save preferences handler
         def handle_save_preferences():
-            current_theme = 'dark' if self.widgets['theme_switch'].get() else 'light'
-            current_city = self.widgets['city_entry'].get()
+            current_theme = 'dark' if self.widgets.theme_switch.get() else 'light'
+            current_city = self.widgets.city_entry.get()
             
             success = self.preferences_manager.save_preferences(current_theme, current_city)
             
             if success:
                 messagebox.showinfo("Settings", "Preferences saved successfully!")
-                self.widgets['status_label'].configure(text="Preferences saved")
+                self.widgets.status_label.configure(text="Preferences saved")
             else:
                 messagebox.showerror("Error", "Failed to save preferences")
-                self.widgets['status_label'].configure(text="Error saving preferences")
+                self.widgets.status_label.configure(text="Error saving preferences")
         
         # Override the placeholder handlers in event_handlers
         self.event_handlers.handle_theme_toggle = handle_theme_toggle
@@ -154,16 +166,13 @@ class WeatherAppController:
         
         # Sync the theme switch with the current theme
         if theme == 'dark':
-            self.widgets['theme_switch'].select()
+            self.widgets.theme_switch.select()
         else:
-            self.widgets['theme_switch'].deselect()
-        
-        # Load initial history
-        self.event_handlers.handle_load_recent_history()
+            self.widgets.theme_switch.deselect()
         
         # Load default city weather after GUI is ready
         default_city = self.preferences_manager.get_preference('default_city', DEFAULT_CITY)
-        self.root.after(100, lambda: self.event_handlers.get_weather(default_city))
+        self.root.after(100, lambda: self.event_handlers.load_default_weather(default_city))
     
     def run(self):
         """Start the application main loop"""
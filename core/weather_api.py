@@ -1,9 +1,13 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import time
+from utils.state_validator import StateValidator
 
 # Load environment variables from .env file
 load_dotenv()
@@ -12,6 +16,15 @@ load_dotenv()
 WEATHER_API_KEY = os.getenv("api_key")
 API_BASE_URL = "https://api.openweathermap.org/data/2.5"
 
+# Shared HTTP session so every WeatherAPI instance reuses pooled keep-alive
+# connections to the OpenWeatherMap host instead of reconnecting per request
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Current-weather results are reused for a few minutes to collapse repeat lookups
+WEATHER_CACHE_TTL = 300  # seconds
+WEATHER_CACHE_MAX_ENTRIES = 128
+
 
 class WeatherAPIError(Exception):
     """Custom exception for Weather API errors"""
@@ -29,6 +42,12 @@ class WeatherAPI:
         else:
             self.api_key = api_key
         self.api_base_url = "https://api.openweathermap.org/data/2.5/weather"
+        self.session = _session  # Shared pooled session; also used by ForecastPredict
+        
+        # TTL + LRU cache of current weather keyed on the normalized location
+        self._weather_cache = OrderedDict()
+        self._weather_cache_lock = threading.Lock()
+        self._state_validator = StateValidator()
         
         # Validate API key during initialization
         self._validate_api_key()
@@ -57,16 +76,49 @@ class WeatherAPI:
                 "Please check your API key at https://openweathermap.org/api"
             )
     
+    def _weather_cache_key(self, city_name, state, country):
+        """Build a normalized cache key so equivalent locations share an entry"""
+        city_key = city_name.strip().lower() if city_name else ''
+        state_key = None
+        if state and state.strip():
+            is_valid, normalized_state, _ = self._state_validator.validate_state(state)
+            state_key = normalized_state if is_valid else state.strip().upper()
+        country_key = country.strip().upper() if country else None
+        return (city_key, state_key, country_key)
+    
     def get_weather_from_api(self, city_name, state=None, country=None):
         """
         Get weather data from OpenWeatherMap API with comprehensive error handling
         
+        Results are cached for WEATHER_CACHE_TTL seconds, so repeated lookups of
+        the same location return without another network request.
+        
         Args:
             city_name (str): Name of the city
             state (str, optional): State code (for US cities) or state name
             country (str, optional): Country code (ISO 3166-1 alpha-2)
         
         """
+        key = self._weather_cache_key(city_name, state, country)
+        
+        with self._weather_cache_lock:
+            cached = self._weather_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < WEATHER_CACHE_TTL:
+                self._weather_cache.move_to_end(key)
+                return dict(cached[1])
+        
+        weather = self._fetch_weather_from_api(city_name, state, country)
+        
+        with self._weather_cache_lock:
+            self._weather_cache[key] = (time.monotonic(), weather)
+            self._weather_cache.move_to_end(key)
+            while len(self._weather_cache) > WEATHER_CACHE_MAX_ENTRIES:
+                self._weather_cache.popitem(last=False)
+        
+        return dict(weather)
+    
+    def _fetch_weather_from_api(self, city_name, state=None, country=None):
+        """Request current weather from the API (uncached)"""
         try:
             # Validate inputs
             if not city_name or not city_name.strip():
@@ -95,7 +147,7 @@ class WeatherAPI:
             
             # Make the request to the API with timeout
             try:
-                response = requests.get(api_url, timeout=10)
+                response = self.session.get(api_url, timeout=10)
             except requests.exceptions.Timeout:
                 raise WeatherAPIError("Request timed out. Please check your internet connection and try again.")
             except requests.exceptions.ConnectionError:
@@ -246,7 +298,7 @@ class WeatherAPI:
             # Use forecast API endpoint
             forecast_url = f"https://api.openweathermap.org/data/2.5/forecast?q={location_query}&appid={self.api_key}&units=imperial"
             
-            response = requests.get(forecast_url, timeout=10)
+            response = self.session.get(forecast_url, timeout=10)
             
             if response.status_code != 200:
                 raise WeatherAPIError(f"Forecast API request failed with status {response.status_code}")
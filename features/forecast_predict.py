@@ -34,7 +34,7 @@ class ForecastPredict:
             url = f"{self.forecast_url}?q={location_query}&appid={self.api.api_key}&units=imperial"
             
             try:
-                response = requests.get(url, timeout=10)
+                response = self.api.session.get(url, timeout=10)
             except requests.exceptions.Timeout:
                 raise WeatherAPIError("Request timed out. Please check your internet connection.")
             except requests.exceptions.ConnectionError:
@@ -2,13 +2,104 @@ from tkinter import messagebox, filedialog
 from datetime import datetime
 import requests
 import os
-import sys
+import logging
+import csv
+import threading
+from collections import deque
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from core.weather_api import WeatherAPIError
 from utils.state_validator import StateValidator
 
-# Add the features directory to the path to import groupFeature
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(current_dir)
+_log = logging.getLogger(__name__)
+
+# CSV comparison plotting needs pandas/numpy/matplotlib, which are optional
+# and only imported the first time a comparison is requested
+pd = np = plt = None
+
+
+def _load_plotting_libraries():
+    """Import the CSV plotting libraries on first use; False if they are missing"""
+    global pd, np, plt
+    if plt is None:
+        try:
+            import pandas
+            import numpy
+            import matplotlib.pyplot
+        except ImportError:
+            return False
+        pd, np, plt = pandas, numpy, matplotlib.pyplot
+    return True
+
+# Project root and the directories searched when auto-detecting CSV files
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_GROUP_CSV_DIR = os.path.join(_BASE_DIR, 'data', 'groupCsvs')
+_DEFAULT_CSV_DIRS = (
+    _GROUP_CSV_DIR,
+    os.path.join(_BASE_DIR, 'data'),
+    os.path.join(_BASE_DIR, 'weather_data'),
+    os.path.join(_BASE_DIR, 'csv_files'),
+    _BASE_DIR,  # Also check root directory
+)
+
+# How many levels below each search directory auto-detect will descend
+CSV_SEARCH_DEPTH = 3
+
+# Subdirectories never descended into when searching for CSV files
+_SKIPPED_SUBDIRS = frozenset({'__pycache__', 'venv', 'node_modules'})
+
+# File suffix treated as CSV when listing directories (compared lower-cased)
+_CSV_SUFFIX = '.csv'
+
+# Enter-key searches wait this long (ms) so rapid repeats collapse into one request
+RETURN_DEBOUNCE_MS = 200
+
+# Format checks read CSVs in blocks of this size, stopping once the header
+# and first data row are complete (or CSV_HEADER_MAX_BYTES have been read)
+CSV_HEADER_READ_BYTES = 8192
+CSV_HEADER_MAX_BYTES = 1024 * 1024
+
+# Upper bound on threads used to validate auto-detected CSVs in parallel
+CSV_VALIDATION_WORKERS = 32
+
+# Header columns the format check looks for, as bit flags. A valid CSV needs
+# the temperature column and at least one datetime column (a Date + Time
+# pair is covered by 'Date' alone).
+_COL_TEMPERATURE = 1 << 0
+_COL_DATETIME = 1 << 1
+_CSV_COLUMN_BITS = {
+    'Temperature_F': _COL_TEMPERATURE,
+    'DateTime': _COL_DATETIME,
+    'Date': _COL_DATETIME,
+    'Timestamp': _COL_DATETIME,
+}
+_CSV_REQUIRED_BITS = _COL_TEMPERATURE | _COL_DATETIME
+
+# Strings pandas reads as NaN by default (pandas' STR_NA_VALUES), so a
+# temperature like "NA" is treated as missing rather than as bad data
+_CSV_NA_VALUES = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null',
+})
+
+# Most recent CSV format checks remembered per (path, mtime, size)
+CSV_VALIDATION_CACHE_SIZE = 256
+
+# Only these columns are used when plotting CSV temperature data
+CSV_PLOT_COLUMNS = frozenset({'DateTime', 'Date', 'Time', 'Temperature_F'})
+
+# CSVs larger than this are read in chunks of CSV_CHUNK_ROWS rows
+LARGE_CSV_BYTES = 50 * 1024 * 1024
+CSV_CHUNK_ROWS = 100_000
+
+# Longer CSV series are decimated to roughly this many points before plotting
+MAX_PLOT_POINTS = 2000
+
+# Comparison plots are saved at this resolution on a single background worker,
+# from an off-screen copy of the figure that pyplot and Tk never touch
+PLOT_DPI = 150
+_plot_save_executor = ThreadPoolExecutor(max_workers=1)
 
 
 class WeatherEventHandlers:
@@ -27,9 +118,44 @@ class WeatherEventHandlers:
         # Initialize state validator
         self.state_validator = StateValidator()
         
+        # CSV directory listings: directory -> (mtime_ns, csv paths, subdirectories)
+        self._csv_file_cache = {}
+        
+        # Parsed temperature CSVs: path -> ((mtime_ns, size), DataFrame)
+        self._csv_frame_cache = {}
+        
+        # CSV format checks: (path, mtime_ns, size) -> bool, least recent first
+        self._csv_validation_cache = OrderedDict()
+        self._csv_validation_lock = threading.Lock()
+        
+        # What the history tab is showing: 'recent', 'statistics' or None
+        self._history_view_mode = None
+        
+        # Widget groups whose events are already bound (tabs are built lazily)
+        self._bound_sections = set()
+        
+        # Pending debounced <Return> callbacks: key -> Tk after id
+        self._after_ids = {}
+        
+        # Latest background request number per action, so a reply that
+        # arrives after a newer request was started is dropped
+        self._request_seq = {}
+        
+        # Last formatted 'Updated' time, reused for searches in the same minute
+        self._last_minute_key = None
+        self._last_minute_str = ''
+        
+        # Comparison plots reuse their figure while its window stays open
+        self._comparison_figures = {}
+        self._color_cache = {}
+        
     def set_widgets(self, widgets):
         """Set widget references for event handling"""
         self.widgets = widgets
+        
+        # Expose each widget as an attribute so handlers skip the dict lookup
+        for name, widget in widgets.items():
+            setattr(self, name, widget)
     
     def _is_zip_code(self, text):
         """Check if the input text is a zip code pattern"""
@@ -56,40 +182,75 @@ class WeatherEventHandlers:
         return False
     
     def bind_events(self):
-        """Bind all events to their respective handlers"""
+        """
+        Bind events for all widgets created so far
+        
+        Feature tabs are built on first selection, so this is called again
+        whenever a tab is built; each group of widgets is only bound once.
+        """
         # Search events
-        self.widgets['city_entry'].bind('<Return>', lambda e: self.handle_search_weather())
-        self.widgets['state_entry'].bind('<Return>', lambda e: self.handle_search_weather())
-        self.widgets['search_btn'].configure(command=self.handle_search_weather)
+        if self._needs_binding('search', 'search_btn'):
+            self.city_entry.bind('<Return>', lambda e: self._debounced('search', self.handle_search_weather))
+            self.state_entry.bind('<Return>', lambda e: self._debounced('search', self.handle_search_weather))
+            self.search_btn.configure(command=self.handle_search_weather)
         
         # Theme events
-        self.widgets['theme_switch'].configure(command=self.handle_theme_toggle)
+        if self._needs_binding('theme', 'theme_switch'):
+            self.theme_switch.configure(command=self.handle_theme_toggle)
         
         # City comparison events
-        self.widgets['city1_entry'].bind('<Return>', lambda e: self.handle_compare_cities())
-        self.widgets['state1_entry'].bind('<Return>', lambda e: self.handle_compare_cities())
-        self.widgets['city2_entry'].bind('<Return>', lambda e: self.handle_compare_cities())
-        self.widgets['state2_entry'].bind('<Return>', lambda e: self.handle_compare_cities())
-        self.widgets['compare_btn'].configure(command=self.handle_compare_cities)
+        if self._needs_binding('compare', 'compare_btn'):
+            self.city1_entry.bind('<Return>', lambda e: self._debounced('compare', self.handle_compare_cities))
+            self.state1_entry.bind('<Return>', lambda e: self._debounced('compare', self.handle_compare_cities))
+            self.city2_entry.bind('<Return>', lambda e: self._debounced('compare', self.handle_compare_cities))
+            self.state2_entry.bind('<Return>', lambda e: self._debounced('compare', self.handle_compare_cities))
+            self.compare_btn.configure(command=self.handle_compare_cities)
         
         # Forecast events
-        self.widgets['forecast_city_entry'].bind('<Return>', lambda e: self.handle_get_forecast())
-        self.widgets['forecast_state_entry'].bind('<Return>', lambda e: self.handle_get_forecast())
-        self.widgets['forecast_btn'].configure(command=self.handle_get_forecast)
+        if self._needs_binding('forecast', 'forecast_btn'):
+            self.forecast_city_entry.bind('<Return>', lambda e: self._debounced('forecast', self.handle_get_forecast))
+            self.forecast_state_entry.bind('<Return>', lambda e: self._debounced('forecast', self.handle_get_forecast))
+            self.forecast_btn.configure(command=self.handle_get_forecast)
         
         # History events
-        self.widgets['recent_btn'].configure(command=self.handle_load_recent_history)
-        self.widgets['stats_btn'].configure(command=self.handle_load_history_statistics)
+        if self._needs_binding('history', 'recent_btn'):
+            self.recent_btn.configure(command=self.handle_load_recent_history)
+            self.stats_btn.configure(command=self.handle_load_history_statistics)
         
         # Group feature events
-        self.widgets['csv_comparison_btn'].configure(command=self.handle_csv_comparison_only)
-        self.widgets['live_csv_comparison_btn'].configure(command=self.handle_live_csv_comparison)
-        self.widgets['browse_csv_btn'].configure(command=self.handle_browse_csv_files)
-        self.widgets['use_default_csv_btn'].configure(command=self.handle_use_default_csv)
-        self.widgets['auto_detect_csv_btn'].configure(command=self.handle_auto_detect_csv)
+        if self._needs_binding('group', 'csv_comparison_btn'):
+            self.csv_comparison_btn.configure(command=self.handle_csv_comparison_only)
+            self.live_csv_comparison_btn.configure(command=self.handle_live_csv_comparison)
+            self.browse_csv_btn.configure(command=self.handle_browse_csv_files)
+            self.use_default_csv_btn.configure(command=self.handle_use_default_csv)
+            self.auto_detect_csv_btn.configure(command=self.handle_auto_detect_csv)
         
         # Settings events
-        self.widgets['save_btn'].configure(command=self.handle_save_preferences)
+        if self._needs_binding('settings', 'save_btn'):
+            self.save_btn.configure(command=self.handle_save_preferences)
+    
+    def _needs_binding(self, section, widget_name):
+        """True the first time a section's widgets exist and can be bound"""
+        if section in self._bound_sections or widget_name not in self.widgets:
+            return False
+        self._bound_sections.add(section)
+        return True
+    
+    def _debounced(self, key, fn, delay=RETURN_DEBOUNCE_MS):
+        """
+        Schedule fn after a short delay, cancelling any call still pending for key
+        
+        Coalesces bursts of Enter presses into a single request.
+        """
+        pending = self._after_ids.pop(key, None)
+        if pending is not None:
+            self.main_frame.after_cancel(pending)
+        
+        def fire():
+            self._after_ids.pop(key, None)
+            fn()
+        
+        self._after_ids[key] = self.main_frame.after(delay, fire)
     
     def _validate_state_input(self, state_input):
         """
@@ -118,8 +279,8 @@ class WeatherEventHandlers:
     def handle_search_weather(self):
         """Handle weather search requests with state validation"""
         
-        city = self.widgets['city_entry'].get().strip()
-        state_input = self.widgets['state_entry'].get().strip() if self.widgets['state_entry'].get() else None
+        city = self.city_entry.get().strip()
+        state_input = self.state_entry.get().strip() if self.state_entry.get() else None
         
         if not city:
             messagebox.showwarning("Warning", "Please enter a city name")
@@ -140,55 +301,107 @@ class WeatherEventHandlers:
         
         self.get_weather(city, normalized_state)
     
+    def _run_in_background(self, action, work, on_done):
+        """
+        Run a blocking call on a worker thread so the Tk event loop stays responsive
+        
+        Replies can finish out of order, so only the most recent request for
+        an action is applied; an older one finishing later is discarded.
+        
+        Args:
+            action (str): Request kind, e.g. 'weather'; newer requests supersede older ones
+            work (callable): Function to run off the UI thread
+            on_done (callable): Called on the Tk thread as on_done(result, error)
+        """
+        seq = self._request_seq.get(action, 0) + 1
+        self._request_seq[action] = seq
+        
+        def apply(result, error):
+            if self._request_seq.get(action) == seq:
+                on_done(result, error)
+        
+        def worker():
+            try:
+                result, error = work(), None
+            except Exception as e:
+                result, error = None, e
+            self.main_frame.after(0, lambda: apply(result, error))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
     def get_weather(self, city, state=None):
         """
         Get weather information for a city with optional state
+        
+        The API request runs in the background; the display is updated by
+        _apply_weather_ui once the result arrives.
         """
+        # Create location display string
+        location_display = city
+        if state:
+            location_display = f"{city}, {state}"
+        
+        self.status_label.configure(text=f"Getting weather for {location_display}...")
+        
+        self._run_in_background(
+            'weather',
+            lambda: self.api.get_weather_from_api(city, state),
+            lambda weather_data, error: self._apply_weather_ui(location_display, weather_data, error)
+        )
+    
+    def load_default_weather(self, city):
+        """Show the startup city's weather, unless the user already searched for one"""
+        if 'weather' not in self._request_seq:
+            self.get_weather(city)
+    
+    def _format_updated_time(self, now):
+        """Format the 'Updated' time, reusing the last string within the same minute"""
+        minute_key = (now.hour, now.minute)
+        if minute_key != self._last_minute_key:
+            self._last_minute_str = now.strftime("%I:%M %p")
+            self._last_minute_key = minute_key
+        return self._last_minute_str
+    
+    def _apply_weather_ui(self, location_display, weather_data, error):
+        """Update the current weather display with a fetched result (Tk thread)"""
         try:
-            # Create location display string
-            location_display = city
-            if state:
-                location_display = f"{city}, {state}"
-            
-            self.widgets['status_label'].configure(text=f"Getting weather for {location_display}...")
-            self.widgets['status_label'].update()
-            
-            weather_data = self.api.get_weather_from_api(city, state)
+            if error is not None:
+                raise error
             
             # Update display
-            self.widgets['city_label'].configure(text=location_display.title())
-            self.widgets['temp_label'].configure(text=f"{weather_data['temperature']:.0f}°F")
-            self.widgets['desc_label'].configure(text=weather_data['description'].title())
-            self.widgets['humidity_label'].configure(text=f"{weather_data['humidity']}%")
-            self.widgets['updated_label'].configure(text=datetime.now().strftime("%I:%M %p"))
+            self.city_label.configure(text=location_display.title())
+            self.temp_label.configure(text=f"{weather_data['temperature']:.0f}°F")
+            self.desc_label.configure(text=weather_data['description'].title())
+            self.humidity_label.configure(text=f"{weather_data['humidity']}%")
+            self.updated_label.configure(text=self._format_updated_time(datetime.now()))
             
             # Save to history (using the full location display)
             self._save_weather_to_history(location_display, weather_data)
             
-            self.widgets['status_label'].configure(text=f"Weather updated for {location_display}")
+            self.status_label.configure(text=f"Weather updated for {location_display}")
             
         except KeyError as e:
             messagebox.showerror("Error", str(e))
-            self.widgets['status_label'].configure(text="City not found")
+            self.status_label.configure(text="City not found")
         except WeatherAPIError as e:
             messagebox.showerror("API Error", str(e))
-            self.widgets['status_label'].configure(text="API error")
+            self.status_label.configure(text="API error")
         except ValueError as e:
             messagebox.showerror("Configuration Error", str(e))
-            self.widgets['status_label'].configure(text="Configuration error")
+            self.status_label.configure(text="Configuration error")
         except requests.exceptions.RequestException as e:
             messagebox.showerror("Network Error", f"Network error: {str(e)}")
-            self.widgets['status_label'].configure(text="Network error")
+            self.status_label.configure(text="Network error")
         except Exception as e:
             messagebox.showerror("Error", f"Unexpected error: {str(e)}")
-            self.widgets['status_label'].configure(text="Unexpected error")
+            self.status_label.configure(text="Unexpected error")
     
     def handle_compare_cities(self):
         """Handle city comparison requests with state validation"""
-        city1 = self.widgets['city1_entry'].get().strip()
-        city2 = self.widgets['city2_entry'].get().strip()
-        state1_input = self.widgets['state1_entry'].get().strip() if self.widgets['state1_entry'].get() else None
-        state2_input = self.widgets['state2_entry'].get().strip() if self.widgets['state2_entry'].get() else None
+        city1 = self.city1_entry.get().strip()
+        city2 = self.city2_entry.get().strip()
+        state1_input = self.state1_entry.get().strip() if self.state1_entry.get() else None
+        state2_input = self.state2_entry.get().strip() if self.state2_entry.get() else None
         
         if not city1 or not city2:
             messagebox.showwarning("Warning", "Please enter both city names")
@@ -221,31 +434,39 @@ class WeatherEventHandlers:
         location1 = f"{city1}, {state1}" if state1 else city1
         location2 = f"{city2}, {state2}" if state2 else city2
         
+        self.status_label.configure(text="Comparing cities...")
+        
+        self._run_in_background(
+            'compare',
+            lambda: self.city_comparison.compare_cities_with_states(city1, city2, state1, state2),
+            lambda comparison_result, error: self._apply_comparison_ui(
+                location1, location2, comparison_result, error)
+        )
+    
+    def _apply_comparison_ui(self, location1, location2, comparison_result, error):
+        """Show a finished city comparison (Tk thread)"""
         try:
-            self.widgets['status_label'].configure(text="Comparing cities...")
-            comparison_result = self.city_comparison.compare_cities_with_states(
-                city1, city2, state1, state2
-            )
+            if error is not None:
+                raise error
             
-            self.widgets['comparison_textbox'].delete("0.0", "end")
-            self.widgets['comparison_textbox'].insert("0.0", comparison_result)
+            self._replace_textbox(self.comparison_textbox, comparison_result)
             
-            self.widgets['status_label'].configure(text=f"Compared {location1} and {location2}")
+            self.status_label.configure(text=f"Compared {location1} and {location2}")
             
         except KeyError as e:
             messagebox.showerror("Error", str(e))
-            self.widgets['status_label'].configure(text="City not found")
+            self.status_label.configure(text="City not found")
         except WeatherAPIError as e:
             messagebox.showerror("API Error", str(e))
-            self.widgets['status_label'].configure(text="API error")
+            self.status_label.configure(text="API error")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to compare cities: {str(e)}")
-            self.widgets['status_label'].configure(text="Error comparing cities")
+            self.status_label.configure(text="Error comparing cities")
     
     def handle_get_forecast(self):
         """Handle 5-day weather forecast requests with state validation"""
-        city = self.widgets['forecast_city_entry'].get().strip()
-        state_input = self.widgets['forecast_state_entry'].get().strip()
+        city = self.forecast_city_entry.get().strip()
+        state_input = self.forecast_state_entry.get().strip()
         
         if not city:
             messagebox.showwarning("Warning", "Please enter a city name")
@@ -263,47 +484,67 @@ class WeatherEventHandlers:
             if not is_valid:
                 return  # Stop execution if state is invalid
         
+        location_text = city
+        if state:
+            location_text = f"{city}, {state}"
+        
+        self.status_label.configure(text=f"Getting 5-day forecast for {location_text}...")
+        
+        self._run_in_background(
+            'forecast',
+            lambda: self.forecast_predict.get_5_day_forecast(city, state),
+            lambda forecast_result, error: self._apply_forecast_ui(location_text, forecast_result, error)
+        )
+    
+    def _apply_forecast_ui(self, location_text, forecast_result, error):
+        """Show a finished 5-day forecast (Tk thread)"""
         try:
-            location_text = city
-            if state:
-                location_text = f"{city}, {state}"
-            
-            self.widgets['status_label'].configure(text=f"Getting 5-day forecast for {location_text}...")
-            self.widgets['status_label'].update()
+            if error is not None:
+                raise error
             
-            forecast_result = self.forecast_predict.get_5_day_forecast(city, state)
+            self._replace_textbox(self.forecast_textbox, forecast_result)
             
-            self.widgets['forecast_textbox'].delete("0.0", "end")
-            self.widgets['forecast_textbox'].insert("0.0", forecast_result)
-            
-            self.widgets['status_label'].configure(text=f"5-day forecast for {location_text}")
+            self.status_label.configure(text=f"5-day forecast for {location_text}")
             
         except WeatherAPIError as e:
             messagebox.showerror("API Error", str(e))
-            self.widgets['status_label'].configure(text="API error")
+            self.status_label.configure(text="API error")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to get forecast: {str(e)}")
-            self.widgets['status_label'].configure(text="Error getting forecast")
+            self.status_label.configure(text="Error getting forecast")
+    
+    def _replace_textbox(self, textbox, text):
+        """
+        Replace a results textbox's contents in a single pass
+        
+        The textbox is left read-only, since it only ever displays results.
+        CTkTextbox wraps a tk.Text, whose replace() swaps the contents in one
+        Tcl call instead of a delete followed by an insert.
+        """
+        text_widget = getattr(textbox, '_textbox', textbox)
+        textbox.configure(state="normal")
+        text_widget.replace("1.0", "end", text)
+        textbox.configure(state="disabled")
     
     def handle_load_recent_history(self):
         """Handle loading recent weather history"""
         try:
             history_content = self.weather_history.get_recent_history(20)
-            self.widgets['history_textbox'].delete("0.0", "end")
-            self.widgets['history_textbox'].insert("0.0", history_content)
         except Exception as e:
-            self.widgets['history_textbox'].delete("0.0", "end")
-            self.widgets['history_textbox'].insert("0.0", f"Error loading history: {e}")
+            history_content = f"Error loading history: {e}"
+        
+        self._replace_textbox(self.history_textbox, history_content)
+        self._history_view_mode = 'recent'
     
     def handle_load_history_statistics(self):
         """Handle loading weather history statistics"""
         try:
             stats_content = self.weather_history.get_statistics()
-            self.widgets['history_textbox'].delete("0.0", "end")
-            self.widgets['history_textbox'].insert("0.0", stats_content)
         except Exception as e:
-            self.widgets['history_textbox'].delete("0.0", "end")
-            self.widgets['history_textbox'].insert("0.0", f"Error loading statistics: {e}")
+            stats_content = f"Error loading statistics: {e}"
+        
+        self._replace_textbox(self.history_textbox, stats_content)
+        self._history_view_mode = 'statistics'
     
     def handle_theme_toggle(self):
         """Handle theme toggle switch change"""
@@ -318,20 +559,15 @@ class WeatherEventHandlers:
     def handle_csv_comparison_only(self):
         """Handle CSV comparison only request - groupCsvs only"""
         try:
-            # Direct implementation to avoid import issues
-            import pandas as pd
-            import matplotlib.pyplot as plt
-            import numpy as np
+            self._require_plotting_libraries()
             
             # Always use groupCsvs folder only
-            group_csv_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'groupCsvs')
+            group_csv_dir = _GROUP_CSV_DIR
             if not os.path.exists(group_csv_dir):
                 group_csv_dir = "groupCsvs"
             
             if os.path.exists(group_csv_dir):
-                csv_files = [os.path.join(group_csv_dir, f) 
-                            for f in os.listdir(group_csv_dir) 
-                            if f.endswith('.csv')]
+                csv_files = self._list_group_csvs(group_csv_dir)
                 print(f"📁 Using {len(csv_files)} CSV files from groupCsvs folder only")
             else:
                 self._update_group_status("❌ GroupCSV directory not found.")
@@ -339,28 +575,21 @@ class WeatherEventHandlers:
             
             self._update_group_status(f"📊 Creating CSV comparison for {len(csv_files)} files...")
             
-            # Create the plot directly
-            plt.figure(figsize=(14, 8))
-            colors = plt.cm.Set1(np.linspace(0, 1, len(csv_files)))
-            labels = [os.path.basename(f).replace('.csv', '') for f in csv_files]
+            # Collect the lines to draw; they are plotted once for display and
+            # once on an off-screen figure that is saved in the background
+            series = []
+            colors = self._plot_colors(len(csv_files))
+            labels = [os.path.splitext(os.path.basename(f))[0] for f in csv_files]
             
             for i, (csv_file, label, color) in enumerate(zip(csv_files, labels, colors)):
                 try:
-                    df = pd.read_csv(csv_file)
-                    
-                    # Create datetime column if needed
-                    if 'DateTime' not in df.columns and 'Date' in df.columns and 'Time' in df.columns:
-                        df['DateTime'] = pd.to_datetime(df['Date'] + ' ' + df['Time'])
-                    
-                    if 'DateTime' in df.columns:
-                        df['DateTime'] = pd.to_datetime(df['DateTime'])
-                        df = df.sort_values('DateTime')
-                        x_data = df['DateTime']
-                    else:
-                        x_data = range(len(df))
+                    df = self._load_temperature_csv(csv_file)
+                    plot_df = self._decimate_for_plot(df)
+                    x_data = plot_df['DateTime'] if 'DateTime' in plot_df.columns else plot_df.index
                     
-                    plt.plot(x_data, df['Temperature_F'], marker='o', markersize=4, 
-                            linewidth=2, label=label, color=color, alpha=0.8)
+                    series.append((x_data, plot_df['Temperature_F'],
+                                   dict(marker='o', markersize=4, linewidth=2,
+                                        label=label, color=color, alpha=0.8)))
                     
                     print(f"✅ Loaded {len(df)} records from {label}")
                     
@@ -368,18 +597,10 @@ class WeatherEventHandlers:
                     print(f"❌ Error loading {csv_file}: {e}")
                     continue
             
-            plt.title("Historical Temperature Data Comparison", fontsize=16, fontweight='bold', pad=20)
-            plt.xlabel("Date/Time", fontsize=12)
-            plt.ylabel("Temperature (°F)", fontsize=12)
-            plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-            plt.grid(True, alpha=0.3)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            
-            output_file = "group_csv_comparison.png"
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            plt.show()
-            self._update_group_status("✅ CSV comparison completed successfully!")
+            self._render_comparison('csv_comparison', (14, 8), series,
+                                    "Historical Temperature Data Comparison",
+                                    "group_csv_comparison.png",
+                                    "✅ CSV comparison completed successfully!")
             
         except Exception as e:
             self._update_group_status(f"❌ Error during CSV comparison: {str(e)}")
@@ -391,21 +612,19 @@ class WeatherEventHandlers:
         
         try:
             # Always use groupCsvs folder, ignore file selection
-            group_csv_dir = "data/groupCsvs/"
+            group_csv_dir = _GROUP_CSV_DIR
             if not os.path.exists(group_csv_dir):
-                group_csv_dir = "groupCsvs/"
+                group_csv_dir = "groupCsvs"
             
             if os.path.exists(group_csv_dir):
-                csv_files = [os.path.join(group_csv_dir, f) 
-                            for f in os.listdir(group_csv_dir) 
-                            if f.endswith('.csv')]
+                csv_files = self._list_group_csvs(group_csv_dir)
                 print(f"📁 Using {len(csv_files)} CSV files from groupCsvs folder")
             else:
                 print("❌ groupCsvs folder not found")
                 return
             
             # Get cities for live data
-            cities_text = self.widgets['live_cities_entry'].get().strip()
+            cities_text = self.live_cities_entry.get().strip()
             if cities_text:
                 raw_cities = [city.strip() for city in cities_text.split(',')]
                 # Filter out zip codes and validate cities
@@ -436,37 +655,26 @@ class WeatherEventHandlers:
             
             print(f"🌡️ Comparing groupCsv data with recent temps for: {', '.join(cities_for_live)}")
             
-            # Use direct implementation instead of external function
-            import pandas as pd
-            import matplotlib.pyplot as plt
-            import numpy as np
-            from core.weather_api import WeatherAPI
+            self._require_plotting_libraries()
             
             self._update_group_status(f"🌡️ Creating CSV + recent temperature comparison...")
             
-            # Create the plot directly
-            plt.figure(figsize=(16, 8))
-            colors = plt.cm.Set1(np.linspace(0, 1, len(csv_files) + 1))
-            labels = [os.path.basename(f).replace('.csv', '') for f in csv_files]
+            # Collect the lines to draw; they are plotted once for display and
+            # once on an off-screen figure that is saved in the background
+            series = []
+            colors = self._plot_colors(len(csv_files) + 1)
+            labels = [os.path.splitext(os.path.basename(f))[0] for f in csv_files]
             
             # Plot CSV data
             for i, (csv_file, label, color) in enumerate(zip(csv_files, labels, colors[:-1])):
                 try:
-                    df = pd.read_csv(csv_file)
-                    
-                    # Create datetime column if needed
-                    if 'DateTime' not in df.columns and 'Date' in df.columns and 'Time' in df.columns:
-                        df['DateTime'] = pd.to_datetime(df['Date'] + ' ' + df['Time'])
+                    df = self._load_temperature_csv(csv_file)
+                    plot_df = self._decimate_for_plot(df)
+                    x_data = plot_df['DateTime'] if 'DateTime' in plot_df.columns else plot_df.index
                     
-                    if 'DateTime' in df.columns:
-                        df['DateTime'] = pd.to_datetime(df['DateTime'])
-                        df = df.sort_values('DateTime')
-                        x_data = df['DateTime']
-                    else:
-                        x_data = range(len(df))
-                    
-                    plt.plot(x_data, df['Temperature_F'], marker='o', markersize=4, 
-                            linewidth=2, label=f'{label} (Historical)', color=color, alpha=0.8)
+                    series.append((x_data, plot_df['Temperature_F'],
+                                   dict(marker='o', markersize=4, linewidth=2,
+                                        label=f'{label} (Historical)', color=color, alpha=0.8)))
                     
                     print(f"✅ Loaded {len(df)} records from {label}")
                     
@@ -476,13 +684,18 @@ class WeatherEventHandlers:
             
             # Add recent weather data
             try:
-                api = WeatherAPI()
+                # Reuse the shared API instance so its pooled connections persist
+                api = self.api
+                
+                # Fetch recent weather data (5 days of data points) for all cities concurrently
+                with ThreadPoolExecutor(max_workers=min(8, len(cities_for_live))) as executor:
+                    futures = {executor.submit(api.get_recent_weather_data, city, days=5): city
+                               for city in cities_for_live}
                 
-                # Get recent weather data for each city
-                for city in cities_for_live:
+                # Plot in the order the cities were entered so the legend stays stable
+                for future, city in futures.items():
                     try:
-                        # Get recent weather data (5 days of data points)
-                        recent_data = api.get_recent_weather_data(city, days=5)
+                        recent_data = future.result()
                         
                         if recent_data:
                             # Extract datetimes and temperatures
@@ -490,9 +703,10 @@ class WeatherEventHandlers:
                             temps = [item['temperature'] for item in recent_data]
                             
                             # Plot recent weather data as a line
-                            plt.plot(datetimes, temps, marker='s', markersize=5, 
-                                    linewidth=2, linestyle='--', alpha=0.7,
-                                    label=f'{city} (Recent Data)')
+                            series.append((datetimes, temps,
+                                           dict(marker='s', markersize=5, linewidth=2,
+                                                linestyle='--', alpha=0.7,
+                                                label=f'{city} (Recent Data)')))
                             
                             print(f"✅ Plotted {len(recent_data)} recent data points for {city}")
                         else:
@@ -505,20 +719,10 @@ class WeatherEventHandlers:
             except Exception as e:
                 print(f"Error fetching recent weather: {e}")
             
-            plt.title("GroupCSV Historical vs Recent Temperature Data", fontsize=16, fontweight='bold', pad=20)
-            plt.xlabel("Date/Time", fontsize=12)
-            plt.ylabel("Temperature (°F)", fontsize=12)
-            plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-            plt.grid(True, alpha=0.3)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            
-            output_file = "group_live_csv_comparison.png"
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            plt.show()
-            
-            self._update_group_status("✅ CSV + Recent temperature comparison completed successfully!")
-            print("✅ GroupCSV comparison completed successfully!")
+            self._render_comparison('live_csv_comparison', (16, 8), series,
+                                    "GroupCSV Historical vs Recent Temperature Data",
+                                    "group_live_csv_comparison.png",
+                                    "✅ CSV + Recent temperature comparison completed successfully!")
             
         except Exception as e:
             error_msg = f"❌ Error in CSV + Recent Temps comparison: {str(e)}"
@@ -528,6 +732,248 @@ class WeatherEventHandlers:
             self._update_group_status(error_msg)
             messagebox.showerror("CSV + Recent Temps Error", error_msg)
 
+    def _list_group_csvs(self, directory):
+        """
+        List the CSV files in a directory, reusing the previous listing while
+        the directory's modification time is unchanged
+        
+        Hidden files are skipped, and names are filtered by extension before
+        the cheaper-than-stat DirEntry.is_file() check.
+        
+        Args:
+            directory (str): Directory to list
+            
+        Returns:
+            list: Paths of the CSV files in the directory
+        """
+        return list(self._scan_directory(directory)[0])
+    
+    def _scan_directory(self, directory):
+        """
+        Scan a directory once for its CSV files and searchable subdirectories,
+        caching the result on the directory's modification time
+        
+        Returns:
+            tuple: (csv paths, subdirectory paths) - callers must not modify them
+        """
+        mtime_ns = os.stat(directory).st_mtime_ns
+        cached = self._csv_file_cache.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+        
+        csv_files = []
+        subdirs = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                if name[-4:].lower() == _CSV_SUFFIX:
+                    if entry.is_file():
+                        csv_files.append(entry.path)
+                elif name not in _SKIPPED_SUBDIRS and entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+        self._csv_file_cache[directory] = (mtime_ns, csv_files, subdirs)
+        return csv_files, subdirs
+    
+    def _iter_csvs(self, roots, max_depth=CSV_SEARCH_DEPTH):
+        """
+        Yield CSV file paths found breadth-first under the given directories
+        
+        Each directory is visited at most once, so overlapping roots (such as
+        the project root and its data folder) are not scanned twice.
+        
+        Args:
+            roots (iterable): Directories to start from
+            max_depth (int): How many levels of subdirectories to descend
+        """
+        seen = set()
+        queue = deque((root, 0) for root in roots)
+        while queue:
+            directory, depth = queue.popleft()
+            if directory in seen:
+                continue
+            seen.add(directory)
+            try:
+                csv_files, subdirs = self._scan_directory(directory)
+            except OSError as e:
+                _log.warning("Could not scan %s: %s", directory, e)
+                continue
+            yield from csv_files
+            if depth < max_depth:
+                queue.extend((subdir, depth + 1) for subdir in subdirs)
+    
+    def _load_temperature_csv(self, csv_file):
+        """
+        Load the columns needed for plotting from a temperature CSV
+        
+        Parsed files are kept in memory and reused until the file's size or
+        modification time changes, so repeat comparisons skip read_csv.
+        
+        Args:
+            csv_file (str): Path to the CSV file
+            
+        Returns:
+            DataFrame: Temperature data, with a DateTime column when available
+        """
+        st = os.stat(csv_file)
+        signature = (st.st_mtime_ns, st.st_size)
+        
+        cached = self._csv_frame_cache.get(csv_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        df = self._read_temperature_csv(csv_file)
+        self._csv_frame_cache[csv_file] = (signature, df)
+        return df
+    
+    def _read_temperature_csv(self, csv_file):
+        """
+        Read a temperature CSV, parsing dates once and sorting rows by time
+        
+        A combined DateTime column is built from separate Date and Time
+        columns when the file doesn't already have one.
+        """
+        read_options = {
+            'usecols': lambda col: col in CSV_PLOT_COLUMNS,
+            'dtype': {'Temperature_F': 'float32'},
+            'engine': 'c',
+        }
+        
+        if os.path.getsize(csv_file) > LARGE_CSV_BYTES:
+            # Stream very large files so only the needed columns are held per chunk
+            chunks = pd.read_csv(csv_file, chunksize=CSV_CHUNK_ROWS, **read_options)
+            df = pd.concat(chunks, ignore_index=True)
+        else:
+            df = pd.read_csv(csv_file, **read_options)
+        
+        if 'DateTime' in df.columns:
+            df['DateTime'] = pd.to_datetime(df['DateTime'], cache=True)
+        elif 'Date' in df.columns and 'Time' in df.columns:
+            df['DateTime'] = pd.to_datetime(df['Date'] + ' ' + df['Time'], cache=True)
+        
+        if 'DateTime' in df.columns:
+            df.sort_values('DateTime', inplace=True)
+        
+        return df
+    
+    def _require_plotting_libraries(self):
+        """Raise ImportError if the optional CSV plotting libraries are missing"""
+        if not _load_plotting_libraries():
+            raise ImportError("pandas, numpy and matplotlib are required for CSV comparisons")
+    
+    def _plot_colors(self, count):
+        """Get `count` evenly spaced Set1 colors, cached per count"""
+        colors = self._color_cache.get(count)
+        if colors is None:
+            colors = plt.cm.Set1(np.linspace(0, 1, count))
+            self._color_cache[count] = colors
+        return colors
+    
+    def _get_comparison_axes(self, name, figsize):
+        """
+        Get a cleared figure and axes for displaying a comparison plot
+        
+        The figure from the previous comparison of the same kind is reused while
+        its window is still open, instead of allocating a new one per click.
+        
+        Args:
+            name (str): Which comparison the figure belongs to
+            figsize (tuple): Size used when a new figure has to be created
+            
+        Returns:
+            tuple: (Figure, Axes) ready for plotting
+        """
+        cached = self._comparison_figures.get(name)
+        if cached is not None and plt.fignum_exists(cached[0].number):
+            fig, ax = cached
+            ax.clear()
+        else:
+            fig, ax = plt.subplots(figsize=figsize)
+            self._comparison_figures[name] = (fig, ax)
+        
+        return fig, ax
+    
+    def _draw_comparison(self, ax, series, title):
+        """
+        Draw comparison lines and the shared axis styling onto ax
+        
+        Args:
+            ax (Axes): Axes to draw on
+            series (list): (x, y, plot kwargs) for each line, in legend order
+            title (str): Plot title
+        """
+        for x_data, y_data, style in series:
+            ax.plot(x_data, y_data, **style)
+        
+        ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
+        ax.set_xlabel("Date/Time", fontsize=12)
+        ax.set_ylabel("Temperature (°F)", fontsize=12)
+        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis='x', labelrotation=45)
+        ax.figure.tight_layout()
+    
+    def _render_comparison(self, name, figsize, series, title, output_file, done_message):
+        """
+        Draw a comparison plot for display and save it as a PNG in the background
+        
+        Matplotlib figures are not thread-safe, and the displayed figure belongs
+        to pyplot and its Tk window, which may redraw it at any time. So the PNG
+        is rendered by the worker from its own off-screen Agg figure built from
+        the same series, and the displayed figure is only shown once it is saved.
+        
+        Args:
+            name (str): Which comparison the display figure belongs to
+            figsize (tuple): Figure size in inches
+            series (list): (x, y, plot kwargs) for each line, in legend order
+            title (str): Plot title
+            output_file (str): Destination PNG path
+            done_message (str): Group status message shown on success
+        """
+        fig, ax = self._get_comparison_axes(name, figsize)
+        self._draw_comparison(ax, series, title)
+        
+        future = _plot_save_executor.submit(self._save_comparison_png, figsize, series, title, output_file)
+        future.add_done_callback(
+            lambda f: self.main_frame.after(
+                0, lambda: self._on_plot_saved(f.exception(), output_file, done_message))
+        )
+    
+    def _save_comparison_png(self, figsize, series, title, output_file):
+        """Render a comparison on a private off-screen figure and save it (worker thread)"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        self._draw_comparison(fig.add_subplot(), series, title)
+        fig.savefig(output_file, dpi=PLOT_DPI, bbox_inches='tight')
+    
+    def _on_plot_saved(self, error, output_file, done_message):
+        """Report a finished plot save and display the figure (Tk thread)"""
+        if error is not None:
+            self._update_group_status(f"❌ Error saving {output_file}: {str(error)}")
+            print(f"Plot save error: {error}")
+            return
+        
+        print(f"📊 Comparison saved as: {output_file}")
+        self._update_group_status(done_message)
+        plt.show()
+    
+    def _decimate_for_plot(self, df):
+        """
+        Thin out long series before plotting
+        
+        Anything beyond MAX_PLOT_POINTS would land on the same pixel columns,
+        so every n-th row is kept instead of drawing thousands of hidden markers.
+        """
+        if len(df) <= MAX_PLOT_POINTS:
+            return df
+        
+        stride = len(df) // MAX_PLOT_POINTS
+        return df.iloc[::stride]
+    
     def handle_browse_csv_files(self):
         """Handle browse CSV files request"""
         try:
@@ -556,16 +1002,13 @@ class WeatherEventHandlers:
         """Handle use default group CSV files request"""
         try:
             # Look for CSV files in the groupCsvs directory
-            csv_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'groupCsvs')
+            csv_dir = _GROUP_CSV_DIR
             
             if not os.path.exists(csv_dir):
                 self._update_group_status("❌ Group CSV directory not found. Use 'Browse CSV Files' instead.")
                 return
             
-            csv_files = []
-            for filename in os.listdir(csv_dir):
-                if filename.endswith('.csv'):
-                    csv_files.append(os.path.join(csv_dir, filename))
+            csv_files = self._list_group_csvs(csv_dir)
             
             if csv_files:
                 self.selected_csv_files = csv_files
@@ -640,46 +1083,58 @@ class WeatherEventHandlers:
         Returns:
             list: List of valid CSV file paths with weather data
         """
-        if directories is None:
-            # Default directories to search for CSV files
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            directories = [
-                os.path.join(base_dir, 'data', 'groupCsvs'),
-                os.path.join(base_dir, 'data'),
-                os.path.join(base_dir, 'weather_data'),
-                os.path.join(base_dir, 'csv_files'),
-                base_dir  # Also check root directory
-            ]
+        # Sort files for consistent ordering
+        csv_files = sorted(self._iter_auto_detected_csvs(directories))
         
-        csv_files = []
+        _log.debug("Auto-detected %d valid CSV files: %s", len(csv_files),
+                   ", ".join(os.path.basename(f) for f in csv_files))
+        return csv_files
+    
+    def _iter_auto_detected_csvs(self, directories=None):
+        """
+        Yield valid weather CSV paths from the search directories in walk order
         
-        for directory in directories:
-            if not os.path.exists(directory):
-                continue
-                
-            print(f"🔍 Scanning directory: {directory}")
-            
-            for filename in os.listdir(directory):
-                if filename.endswith('.csv'):
-                    filepath = os.path.join(directory, filename)
-                    
-                    # Validate CSV file format
-                    if self._validate_csv_format(filepath):
-                        csv_files.append(filepath)
-                        print(f"✅ Found valid CSV: {filename}")
-                    else:
-                        print(f"⚠️ Skipped invalid CSV format: {filename}")
+        Validation runs in parallel, but results are yielded as soon as each
+        file's check is done, and closing the generator early cancels any
+        checks that have not started.
         
-        # Sort files for consistent ordering
-        csv_files.sort()
+        Args:
+            directories (list, optional): List of directories to search. If None, uses default directories.
+        """
+        if directories is None:
+            directories = _DEFAULT_CSV_DIRS
         
-        print(f"📊 Auto-detected {len(csv_files)} valid CSV files")
-        return csv_files
+        # Drop duplicates and anything that is not an existing directory
+        directories = [d for d in dict.fromkeys(directories) if os.path.isdir(d)]
+        
+        _log.debug("Scanning directories: %s", ", ".join(directories))
+        # The same file can be reachable through overlapping directories or
+        # symlinks, so only validate each real path once
+        seen = set()
+        candidates = []
+        for filepath in self._iter_csvs(directories):
+            real_path = os.path.realpath(filepath)
+            if real_path not in seen:
+                seen.add(real_path)
+                candidates.append(filepath)
+        
+        # Validate CSV file formats in parallel; the checks are I/O bound
+        executor = ThreadPoolExecutor(max_workers=min(CSV_VALIDATION_WORKERS, len(candidates) or 1))
+        try:
+            results = executor.map(self._validate_csv_format, candidates)
+            for filepath, is_valid in zip(candidates, results):
+                if is_valid:
+                    yield filepath
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def _validate_csv_format(self, filepath):
         """
         Validate that a CSV file has the expected weather data format
         
+        Results are cached on the file's mtime and size, so files that have
+        not changed since the last auto-detect are not read again.
+        
         Args:
             filepath (str): Path to the CSV file
             
@@ -687,90 +1142,107 @@ class WeatherEventHandlers:
             bool: True if the CSV has valid weather data format
         """
         try:
-            import pandas as pd
-            
-            # Read just the first few rows to check format
-            df = pd.read_csv(filepath, nrows=5)
-            
-            # Check for required columns
-            required_columns = ['Temperature_F']
-            has_temp_column = any(col in df.columns for col in required_columns)
-            
-            # Check for datetime columns (various formats supported)
-            datetime_patterns = [
-                'DateTime',
-                ['Date', 'Time'],
-                'Date',
-                'Timestamp'
-            ]
-            
-            has_datetime = False
-            for pattern in datetime_patterns:
-                if isinstance(pattern, list):
-                    # Check if both Date and Time columns exist
-                    if all(col in df.columns for col in pattern):
-                        has_datetime = True
-                        break
-                else:
-                    # Check if single datetime column exists
-                    if pattern in df.columns:
-                        has_datetime = True
+            stat = os.stat(filepath)
+        except OSError as e:
+            _log.warning("Error validating %s: %s", filepath, e)
+            return False
+        
+        key = (filepath, stat.st_mtime_ns, stat.st_size)
+        cache = self._csv_validation_cache
+        with self._csv_validation_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        
+        is_valid = self._check_csv_format(filepath)
+        with self._csv_validation_lock:
+            cache[key] = is_valid
+            if len(cache) > CSV_VALIDATION_CACHE_SIZE:
+                cache.popitem(last=False)
+        return is_valid
+    
+    def _check_csv_format(self, filepath):
+        """Read the start of a CSV file and check its columns (uncached)"""
+        try:
+            # Read small blocks and parse just the header and first data row;
+            # usually one block is enough, but very wide headers may need more.
+            # Blank lines are skipped, as pandas does
+            lines = []
+            pending = b''
+            with open(filepath, 'rb') as f:
+                read = 0
+                while len(lines) < 2 and read < CSV_HEADER_MAX_BYTES:
+                    block = f.read(CSV_HEADER_READ_BYTES)
+                    if not block:
                         break
+                    read += len(block)
+                    *complete, pending = (pending + block).split(b'\n')
+                    lines.extend(line for line in complete if line.strip())
+            if len(lines) < 2 and pending.strip():
+                lines.append(pending)
+            lines = b'\n'.join(lines[:2]).decode('utf-8-sig', 'replace').splitlines()
+            reader = csv.reader(lines)
+            header = next(reader, None) or []
+            first_row = next(reader, None)
+            
+            # Collect the known columns as bits, noting where the temperature is
+            # (first occurrence wins, as in pandas)
+            found = 0
+            temp_index = None
+            for index, name in enumerate(header):
+                bit = _CSV_COLUMN_BITS.get(name, 0)
+                if bit == _COL_TEMPERATURE and temp_index is None:
+                    temp_index = index
+                found |= bit
             
             # Must have temperature data and some form of datetime
-            is_valid = has_temp_column and has_datetime
+            if found != _CSV_REQUIRED_BITS:
+                return False
             
-            if is_valid and len(df) > 0:
-                # Additional check: ensure we can read at least one temperature value
+            # Ensure we can read the first temperature value, if there is one
+            # (a missing, blank or NA value is allowed, as pandas would read it as NaN)
+            value = first_row[temp_index].strip() if first_row and temp_index < len(first_row) else ''
+            if value not in _CSV_NA_VALUES:
+                # float() accepts digit separators like 1_000, pandas doesn't
+                if '_' in value:
+                    return False
                 try:
-                    temp_col = next(col for col in required_columns if col in df.columns)
-                    pd.to_numeric(df[temp_col].iloc[0])
-                    return True
-                except (ValueError, IndexError):
+                    float(value)
+                except ValueError:
                     return False
-            
-            return is_valid
+            return True
             
         except Exception as e:
-            print(f"❌ Error validating {filepath}: {e}")
+            _log.warning("Error validating %s: %s", filepath, e)
             return False
     
     def _get_csv_files(self):
         """Get the currently selected CSV files or auto-detect them"""
         # First, check if user has manually selected files
         if hasattr(self, 'selected_csv_files') and self.selected_csv_files:
-            print("📁 Using manually selected CSV files")
+            _log.debug("Using manually selected CSV files")
             return self.selected_csv_files
         
         # If no manual selection, use auto-detection
-        print("🔍 Auto-detecting CSV files...")
         csv_files = self.auto_detect_csv_files()
         
         if csv_files:
-            print(f"✅ Auto-detected {len(csv_files)} CSV files:")
-            for file in csv_files:
-                print(f"  • {os.path.basename(file)}")
             return csv_files
         
         # Fallback: Try the old method for backwards compatibility
-        print("⚠️ Auto-detection found no files, trying legacy method...")
-        csv_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'groupCsvs')
-        if os.path.exists(csv_dir):
-            csv_files = []
-            for filename in os.listdir(csv_dir):
-                if filename.endswith('.csv'):
-                    csv_files.append(os.path.join(csv_dir, filename))
+        _log.debug("Auto-detection found no files, trying legacy method")
+        if os.path.isdir(_GROUP_CSV_DIR):
+            csv_files = self._list_group_csvs(_GROUP_CSV_DIR)
             if csv_files:
                 return csv_files
         
-        print("❌ No CSV files found")
+        _log.debug("No CSV files found")
         return []
     
     def _update_group_status(self, message):
         """Update the group feature status text"""
         if 'group_textbox' in self.widgets:
-            self.widgets['group_textbox'].delete("0.0", "end")
-            self.widgets['group_textbox'].insert("0.0", message)
+            self._replace_textbox(self.group_textbox, message)
     
     def _save_weather_to_history(self, city, weather_data):
         """
@@ -779,8 +1251,7 @@ class WeatherEventHandlers:
         try:
             self.weather_history.add_weather_record(city, weather_data)
             # Update history display if it's currently showing recent history
-            current_content = self.widgets['history_textbox'].get("0.0", "end")
-            if "Recent Weather History" in current_content:
+            if self._history_view_mode == 'recent':
                 self.handle_load_recent_history()
         except Exception as e:
             print(f"Failed to save to history: {e}")
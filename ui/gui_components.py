@@ -3,8 +3,185 @@ GUI Components Module - Contains all UI widget creation and layout logic
 Separates UI construction from business logic and event handling
 """
 
-import customtkinter as ctk
-from datetime import datetime
+# customtkinter (and the Pillow/darkdetect stack behind it) is imported when
+# the GUI is first constructed, not when this module is imported
+ctk = None
+
+
+def _load_customtkinter():
+    """Import customtkinter on first use"""
+    global ctk
+    if ctk is None:
+        import customtkinter
+        ctk = customtkinter
+    return ctk
+
+
+# Entry placeholder text
+_PH_CITY = "Enter city name..."
+_PH_STATE_OPT = "Optional (FL, TX, California, etc.)"
+_PH_STATE_OPT2 = "Optional (CA, Texas, FL, etc.)"
+_PH_CITY1 = "Enter first city..."
+_PH_STATE1 = "FL, California, etc."
+_PH_CITY2 = "Enter second city..."
+_PH_STATE2 = "TX, New York, etc."
+_PH_LIVE_CITIES = "Toronto, Lincoln, Rockland, Los Angeles"
+
+# Button labels
+_BTN_SEARCH = "Get Weather"
+_BTN_COMPARE = "🔄 Compare"
+_BTN_FORECAST = "📅 5-Day Forecast"
+_BTN_RECENT = "📈 Recent"
+_BTN_STATS = "📊 Statistics"
+_BTN_SAVE = "💾 Save Settings"
+_BTN_CSV_ONLY = "📊 CSV Comparison Only"
+_BTN_CSV_RECENT = "🌡️ CSV + Recent Temps"
+_BTN_BROWSE = "📂 Browse CSV Files"
+_BTN_GROUP_CSVS = "📋 Use Group CSVs"
+_BTN_AUTO_DETECT = "🔍 Auto-Detect CSVs"
+
+# Colors not taken from the theme file, as (light, dark) pairs like the theme
+# itself so CTk recolors them in place when the appearance mode changes
+PALETTE = {
+    "accent": ("#5400D2", "#C4A7E7"),
+    "temperature": ("#000000", "#FFFFFF"),
+    "note": ("gray40", "gray60"),
+}
+
+# Help text shown in the Group Feature tab until the first status update
+_GROUP_INITIAL_MESSAGE = ("🌤️ Temperature Comparison Tools\n\n"
+                          "📊 CSV Comparison Only: Compare historical temperature data from multiple CSV files\n"
+                          "🌡️ CSV + Recent Temps: Combine historical data with recent temperature trends\n\n"
+                          "Instructions:\n"
+                          "1. Enter cities for temperature data (optional)\n"
+                          "2. Choose CSV files or use default group CSVs\n"
+                          "3. Click a comparison button to generate graphs\n\n"
+                          "Supported CSV format: Date, Time, City, Temperature_F\n"
+                          "Generated plots will be saved in the WeatherCap directory.")
+
+# Feature tabs in display order. Each tab gets a frame with an optional title,
+# the controls built by its "section" method, and a results textbox (under an
+# optional "results" heading). "textbox" names the widget key, if handlers need it.
+TAB_SPECS = (
+    {
+        "name": "City Comparison",
+        "title": "City Weather Comparison", "title_pady": (5, 5),
+        "section": "_create_comparison_inputs",
+        "results": "Comparison Results", "results_pady": (5, 5),
+        "textbox": "comparison_textbox", "font_size": 12,
+        "initial": "Enter two cities above and click 'Compare Cities' to see detailed weather comparison.",
+    },
+    {
+        "name": "Weather Forecast",
+        "title": "Weather Forecast", "title_pady": (10, 15),
+        "section": "_create_forecast_inputs",
+        "results": "Forecast Results", "results_pady": (0, 20),
+        "textbox": "forecast_textbox", "font_size": 11,
+        "initial": "Enter a city name (and optional state) above and click:\n• '5-Day Forecast' for detailed weather predictions\n• 'Weather Trends' for analysis\n• 'Accuracy Report' to see how accurate our past forecasts were\n\nTip: Add state (e.g., CA, TX) to distinguish between cities with the same name",
+    },
+    {
+        "name": "Weather History",
+        "section": "_create_history_header",
+        "textbox": "history_textbox", "font_size": 12,
+    },
+    {
+        "name": "Group Feature",
+        "title": "Temperature Comparison", "title_pady": (10, 15),
+        "section": "_create_group_sections",
+        "results": "Results & Status", "results_pady": (0, 20),
+        "textbox": "group_textbox", "font_size": 11,
+        "initial": _GROUP_INITIAL_MESSAGE,
+    },
+    {
+        "name": "Settings & Preferences",
+        "title": "Settings & Preferences", "title_pady": (20, 15),
+        "section": "_create_settings_sections",
+        "results": "Application Info", "results_pady": (0, 20),
+        "textbox_height": 100,
+        "initial": "WeatherCap Dashboard v1.0\n\n• Real-time weather data\n• City comparison features\n• Dark/Light theme support\n• Weather history tracking\n• User preference persistence",
+    },
+)
+
+
+class PlaceholderTextbox:
+    """
+    Stands in for a results CTkTextbox that has only shown its initial text
+    
+    The initial text is shown in a plain label, and the real textbox is only
+    created (replacing the label) the first time anything on it is used, so
+    tabs whose results are never written skip the Text widget entirely.
+    """
+    
+    def __init__(self, master, text, **textbox_options):
+        self._options = textbox_options
+        self._widget = None
+        self._placeholder = ctk.CTkLabel(master, text=text, font=textbox_options.get("font"),
+                                         justify="left", anchor="nw", wraplength=420)
+        self._placeholder.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+    
+    def _get_textbox(self):
+        """Create the real textbox in the placeholder's place on first use"""
+        if self._widget is None:
+            placeholder = self._placeholder
+            self._widget = ctk.CTkTextbox(placeholder.master, **self._options)
+            self._widget.pack(fill="both", expand=True, padx=20, pady=(0, 20), after=placeholder)
+            self._widget.insert("0.0", placeholder.cget("text"))
+            placeholder.destroy()
+        return self._widget
+    
+    def __getattr__(self, name):
+        return getattr(self._get_textbox(), name)
+
+
+class Widgets:
+    """
+    Named references to every widget the rest of the app works with
+    
+    Widgets are read as attributes (``widgets.city_entry``). The dict-style
+    methods stay for callers that look widgets up by name; slots belonging
+    to feature tabs that have not been built yet are simply unset.
+    """
+    
+    __slots__ = (
+        # Header, search and current weather
+        'main_frame', 'theme_switch', 'city_entry', 'state_entry', 'search_btn',
+        'content_frame', 'weather_frame', 'city_label', 'temp_label', 'desc_label',
+        'humidity_label', 'updated_label', 'tabview', 'status_frame', 'status_label',
+        # Feature tabs
+        'city1_entry', 'state1_entry', 'city2_entry', 'state2_entry', 'compare_btn',
+        'comparison_textbox', 'forecast_city_entry', 'forecast_state_entry',
+        'forecast_btn', 'forecast_textbox', 'recent_btn', 'stats_btn', 'history_textbox',
+        'csv_comparison_btn', 'live_csv_comparison_btn', 'live_cities_entry',
+        'browse_csv_btn', 'use_default_csv_btn', 'auto_detect_csv_btn', 'group_textbox',
+        'save_btn',
+    )
+    _names = frozenset(__slots__)
+    
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+    
+    def __setitem__(self, name, widget):
+        setattr(self, name, widget)
+    
+    def __contains__(self, name):
+        return name in self._names and hasattr(self, name)
+    
+    def __iter__(self):
+        return (name for name in self.__slots__ if hasattr(self, name))
+    
+    def __len__(self):
+        return sum(1 for _ in self)
+    
+    def get(self, name, default=None):
+        """Get a widget by name, or default if it doesn't exist (yet)"""
+        return getattr(self, name, default) if name in self._names else default
+    
+    def items(self):
+        """(name, widget) pairs for every widget created so far"""
+        return [(name, getattr(self, name)) for name in self]
 
 
 class WeatherGUIComponents:
@@ -16,121 +193,120 @@ class WeatherGUIComponents:
         
         Args:
             root: The main CTk root window
-            preferences (dict): User preferences        #         initial_message = ("🌤️ Temperature Comparison Tools\n\n"
-                          "📊 CSV Comparison Only: Compare historical temperature data from multiple CSV files\n"
-                          "🌐 CSV + Recent Temps: Combine historical data with recent temperature trends\n\n"
-                          "Instructions:\n"
-                          "1. Enter cities for temperature data (optional)\n"
-                          "2. Choose CSV files or use default group CSVs\n"
-                          "3. Click a comparison button to generate graphs\n\n"
-                          "Supported CSV format: Date, Time, City, Temperature_F\n"
-                          "Generated plots will be saved in the WeatherCap directory.")ssage
-        initial_message = ("🌤️ Temperature Comparison Tools\n\n"
-                          "📊 CSV Comparison Only: Compare historical temperature data from multiple CSV files\n"
-                          "🌐 CSV + Recent Temps: Combine historical data with recent temperature trends\n\n"
-                          "Instructions:\n"
-                          "1. Enter cities for temperature data (optional)\n"
-                          "2. Choose CSV files or use default group CSVs\n"
-                          "3. Click a comparison button to generate graphs\n\n"
-                          "Supported CSV format: Date, Time, City, Temperature_F\n"
-                          "Generated plots will be saved in the WeatherCap directory.")itial_message = ("�️ Temperature Comparison Tools\n\n"
-                          "📊 CSV Comparison Only: Compare historical temperature data from multiple CSV files\n"
-                          "�️ CSV + Recent Temps: Combine historical data with recent temperature trends\n"
-                          "🎬 Run Demo: See a demonstration with sample data\n\n"
-                          "Instructions:\n"
-                          "1. Enter cities for temperature data (optional)\n"
-                          "2. Choose CSV files or use default group CSVs\n"
-                          "3. Click a comparison button to generate graphs\n\n"
-                          "Supported CSV format: Date, Time, City, Temperature_F\n"
-                          "Generated plots will be saved in the WeatherCap directory.")t values
+            preferences (dict): User preferences
         """
+        _load_customtkinter()
         self.root = root
         self.preferences = preferences
-        self.widgets = {}  # Store widget references
+        self.widgets = Widgets()  # Store widget references
+        
+        # Feature tabs are built the first time they are shown: name -> spec
+        self._tab_specs = {spec["name"]: spec for spec in TAB_SPECS}
+        self._tab_built = set()
+        
+        # Called with the tab name after a feature tab's widgets are created
+        self.on_tab_built = None
+        
+        # Shared CTkFont instances: (size, weight, slant) -> font
+        self._fonts = {}
         
     def setup_main_layout(self):
-        """Create the main application layout structure"""
-        # Main container
-        self.widgets['main_frame'] = ctk.CTkFrame(self.root)
-        self.widgets['main_frame'].pack(fill="both", expand=True, padx=20, pady=20)
+        """
+        Create the main application layout structure
         
-        # Create all major sections
-        self._create_header_frame()
-        self._create_search_frame()
-        self._create_main_content()
-        self._create_status_bar()
+        Returns:
+            Widgets: The shared widget record; feature tab widgets are added
+            to it as each tab is first shown
+        """
+        # Keep the window transparent while building so Tk lays it out and paints
+        # once. withdraw() is avoided: CTk remembers a withdraw made before the
+        # window exists and keeps it hidden after the Windows titlebar recolor
+        self.root.attributes('-alpha', 0)
+        try:
+            # Main container
+            self.widgets.main_frame = ctk.CTkFrame(self.root)
+            self.widgets.main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+            # Sized by the window geometry, so children need not propagate up to the root
+            self.widgets.main_frame.pack_propagate(False)
+            
+            # Create all major sections
+            self._create_header_frame()
+            self._create_search_frame()
+            self._create_main_content()
+            self._create_status_bar()
+        finally:
+            self.root.update_idletasks()
+            self.root.attributes('-alpha', 1)
         
         return self.widgets
     
     def _create_header_frame(self):
         """Create the header with title and theme controls"""
-        header_frame = ctk.CTkFrame(self.widgets['main_frame'])
+        header_frame = self._plain_frame(self.widgets.main_frame)
         header_frame.pack(fill="x", pady=(10, 30))
         
         # Title on the left side
-        title_label = ctk.CTkLabel(header_frame, text="WeatherCap Dashboard", 
-                                  font=ctk.CTkFont(size=28, weight="bold"))
+        title_label = self._title(header_frame, "WeatherCap Dashboard", 28)
         title_label.pack(side="left", padx=(20, 0), pady=15)
         
         # Theme switcher on the right side
-        theme_frame = ctk.CTkFrame(header_frame)
+        theme_frame = self._plain_frame(header_frame)
         theme_frame.pack(side="right", padx=(0, 20), pady=15)
         
         # Dark mode toggle
         ctk.CTkLabel(theme_frame, text="Dark Mode:", 
-                    font=ctk.CTkFont(size=12, weight="bold")).pack(side="left", padx=(10, 8))
+                    font=self._f(12, "bold")).pack(side="left", padx=(10, 8))
         
         # Create theme toggle switch
-        self.widgets['theme_switch'] = ctk.CTkSwitch(theme_frame, text="", width=50, height=24)
+        self.widgets.theme_switch = ctk.CTkSwitch(theme_frame, text="", width=50, height=24)
         
         # Set initial state based on preferences
         if self.preferences.get('theme', 'light') == 'dark':
-            self.widgets['theme_switch'].select()
+            self.widgets.theme_switch.select()
         else:
-            self.widgets['theme_switch'].deselect()
+            self.widgets.theme_switch.deselect()
             
-        self.widgets['theme_switch'].pack(side="left", padx=(0, 10))
+        self.widgets.theme_switch.pack(side="left", padx=(0, 10))
     
     def _create_search_frame(self):
         """Create the city and state search interface"""
-        search_frame = ctk.CTkFrame(self.widgets['main_frame'])
+        search_frame = ctk.CTkFrame(self.widgets.main_frame)
         search_frame.pack(fill="x", padx=10, pady=(0, 20))
         
         # Title
-        search_title = ctk.CTkLabel(search_frame, text="Search Weather", 
-                                   font=ctk.CTkFont(size=16, weight="bold"))
+        search_title = self._title(search_frame, "Search Weather", 16)
         search_title.pack(pady=(15, 10))
         
         # Search container
-        search_container = ctk.CTkFrame(search_frame)
+        search_container = self._plain_frame(search_frame)
         search_container.pack(fill="x", padx=20, pady=(0, 15))
         
         # City label and entry
         ctk.CTkLabel(search_container, text="City:", 
-                    font=ctk.CTkFont(size=14)).pack(side="left", padx=(10, 5))
+                    font=self._f(14)).pack(side="left", padx=(10, 5))
         
-        self.widgets['city_entry'] = ctk.CTkEntry(search_container, placeholder_text="Enter city name...", 
-                                      width=250, font=ctk.CTkFont(size=14))
-        self.widgets['city_entry'].pack(side="left", padx=(0, 10), pady=10)
-        self.widgets['city_entry'].insert(0, self.preferences.get('default_city', 'Miami'))
+        self.widgets.city_entry = ctk.CTkEntry(search_container, placeholder_text=_PH_CITY, 
+                                      width=250, font=self._f(14))
+        self.widgets.city_entry.pack(side="left", padx=(0, 10), pady=10)
+        self.widgets.city_entry.insert(0, self.preferences.get('default_city', 'Miami'))
         
         # State label and entry (optional)
         ctk.CTkLabel(search_container, text="State:", 
-                    font=ctk.CTkFont(size=14)).pack(side="left", padx=(5, 5))
+                    font=self._f(14)).pack(side="left", padx=(5, 5))
         
-        self.widgets['state_entry'] = ctk.CTkEntry(search_container, placeholder_text="Optional (FL, TX, California, etc.)", 
-                                       width=200, font=ctk.CTkFont(size=14))
-        self.widgets['state_entry'].pack(side="left", padx=(0, 10), pady=10)
+        self.widgets.state_entry = ctk.CTkEntry(search_container, placeholder_text=_PH_STATE_OPT, 
+                                       width=200, font=self._f(14))
+        self.widgets.state_entry.pack(side="left", padx=(0, 10), pady=10)
         
-        self.widgets['search_btn'] = ctk.CTkButton(search_container, text="Get Weather", 
-                                       width=120, font=ctk.CTkFont(size=14, weight="bold"))
-        self.widgets['search_btn'].pack(side="left", padx=(0, 10), pady=10)
+        self.widgets.search_btn = ctk.CTkButton(search_container, text=_BTN_SEARCH, 
+                                       width=120, font=self._f(14, "bold"))
+        self.widgets.search_btn.pack(side="left", padx=(0, 10), pady=10)
     
     def _create_main_content(self):
         """Create the main content area with side-by-side layout"""
         # Main content container
-        self.widgets['content_frame'] = ctk.CTkFrame(self.widgets['main_frame'])
-        self.widgets['content_frame'].pack(fill="both", expand=True, padx=10, pady=(0, 20))
+        self.widgets.content_frame = ctk.CTkFrame(self.widgets.main_frame)
+        self.widgets.content_frame.pack(fill="both", expand=True, padx=10, pady=(0, 20))
         
         # Left side - Current weather display
         self._create_weather_display()
@@ -140,298 +316,242 @@ class WeatherGUIComponents:
     
     def _create_weather_display(self):
         """Create the main weather information display"""
-        self.widgets['weather_frame'] = ctk.CTkFrame(self.widgets['content_frame'])
-        self.widgets['weather_frame'].pack(side="left", fill="y", expand=False, padx=(10, 10), pady=10)
-        self.widgets['weather_frame'].configure(width=380)  # Fixed width for weather display
+        # Fixed-size card laid out on a single two-column grid
+        weather_frame = ctk.CTkFrame(self.widgets.content_frame, width=380)  # Fixed width for weather display
+        weather_frame.pack(side="left", fill="y", expand=False, padx=(10, 10), pady=10)
+        weather_frame.grid_propagate(False)
+        weather_frame.grid_columnconfigure((0, 1), weight=1)
+        self.widgets.weather_frame = weather_frame
         
         # Title
-        weather_title = ctk.CTkLabel(self.widgets['weather_frame'], text="Current Weather", 
-                                    font=ctk.CTkFont(size=16, weight="bold"))
-        weather_title.pack(pady=(15, 5))
+        self._title(weather_frame, "Current Weather", 16).grid(row=0, column=0, columnspan=2, pady=(15, 5))
         
         # City name
-        self.widgets['city_label'] = ctk.CTkLabel(self.widgets['weather_frame'], text="Select a city", 
-                                      font=ctk.CTkFont(size=20, weight="bold"))
-        self.widgets['city_label'].pack(pady=(5, 10))
-        
-        # Temperature display container
-        temp_container = ctk.CTkFrame(self.widgets['weather_frame'], corner_radius=50)
-        temp_container.pack(pady=10)
-        
-        # Temperature
-        self.widgets['temp_label'] = ctk.CTkLabel(temp_container, text="--°F", 
-                                      font=ctk.CTkFont(size=48, weight="bold"),
-                                      text_color="#000000")
-        self.widgets['temp_label'].pack(padx=30, pady=20)
+        self.widgets.city_label = ctk.CTkLabel(weather_frame, text="Select a city", 
+                                      font=self._f(20, "bold"))
+        self.widgets.city_label.grid(row=1, column=0, columnspan=2, pady=(5, 10))
+        
+        # Temperature, on the rounded background the nested card frames use
+        self.widgets.temp_label = ctk.CTkLabel(weather_frame, text="--°F", 
+                                      font=self._f(48, "bold"),
+                                      text_color=PALETTE["temperature"],
+                                      fg_color=ctk.ThemeManager.theme["CTkFrame"]["top_fg_color"],
+                                      corner_radius=50, padx=30, pady=20)
+        self.widgets.temp_label.grid(row=2, column=0, columnspan=2, pady=10)
         
         # Description
-        self.widgets['desc_label'] = ctk.CTkLabel(self.widgets['weather_frame'], text="--", 
-                                      font=ctk.CTkFont(size=16))
-        self.widgets['desc_label'].pack(pady=(0, 10))
-        
-        # Additional info container
-        info_container = ctk.CTkFrame(self.widgets['weather_frame'])
-        info_container.pack(pady=(0, 15))
-        
-        # Info grid
-        info_grid = ctk.CTkFrame(info_container)
-        info_grid.pack(padx=20, pady=15)
-        
-        # Humidity
-        humidity_frame = ctk.CTkFrame(info_grid)
-        humidity_frame.pack(side="left", padx=10)
-        
-        ctk.CTkLabel(humidity_frame, text="Humidity", 
-                    font=ctk.CTkFont(size=12, weight="bold"), text_color="#5400D2").pack(pady=(10, 5))
-        self.widgets['humidity_label'] = ctk.CTkLabel(humidity_frame, text="--%", 
-                                          font=ctk.CTkFont(size=14))
-        self.widgets['humidity_label'].pack(pady=(0, 10))
-        
-        # Last updated
-        updated_frame = ctk.CTkFrame(info_grid)
-        updated_frame.pack(side="left", padx=10)
-        
-        ctk.CTkLabel(updated_frame, text="Updated", 
-                    font=ctk.CTkFont(size=12, weight="bold"), text_color="#5400D2").pack(pady=(10, 5))
-        self.widgets['updated_label'] = ctk.CTkLabel(updated_frame, text="--", 
-                                         font=ctk.CTkFont(size=14))
-        self.widgets['updated_label'].pack(pady=(0, 10))
+        self.widgets.desc_label = ctk.CTkLabel(weather_frame, text="--", 
+                                      font=self._f(16))
+        self.widgets.desc_label.grid(row=3, column=0, columnspan=2, pady=(0, 25))
+        
+        # Humidity and last updated side by side
+        for column, heading in enumerate(("Humidity", "Updated")):
+            ctk.CTkLabel(weather_frame, text=heading, 
+                        font=self._f(12, "bold"), text_color=PALETTE["accent"]).grid(row=4, column=column, pady=(10, 5))
+        
+        self.widgets.humidity_label = ctk.CTkLabel(weather_frame, text="--%", 
+                                          font=self._f(14))
+        self.widgets.humidity_label.grid(row=5, column=0, pady=(0, 25))
+        
+        self.widgets.updated_label = ctk.CTkLabel(weather_frame, text="--", 
+                                         font=self._f(14))
+        self.widgets.updated_label.grid(row=5, column=1, pady=(0, 25))
     
     def _create_features_tabs(self):
         """Create the features tabview"""
-        self.widgets['tabview'] = ctk.CTkTabview(self.widgets['content_frame'], width=520, height=420)
-        self.widgets['tabview'].pack(side="right", fill="both", expand=True, padx=(0, 10), pady=10)
-        
-        # Create tabs
-        self.widgets['tabview'].add("City Comparison")
-        self.widgets['tabview'].add("Weather Forecast")
-        self.widgets['tabview'].add("Weather History")
-        self.widgets['tabview'].add("Group Feature")
-        self.widgets['tabview'].add("Settings & Preferences")
-        
-        # Create tab contents
-        self._create_city_comparison_tab()
-        self._create_forecast_tab()
-        self._create_history_tab()
-        self._create_group_feature_tab()
-        self._create_settings_tab()
-    
-    def _create_city_comparison_tab(self):
-        """Create the city comparison interface"""
-        parent = self.widgets['tabview'].tab("City Comparison")
-        comparison_frame = ctk.CTkFrame(parent)
-        comparison_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        self.widgets.tabview = ctk.CTkTabview(self.widgets.content_frame, width=520, height=420,
+                                                 command=self._on_tab_selected)
+        self.widgets.tabview.pack(side="right", fill="both", expand=True, padx=(0, 10), pady=10)
+        self.widgets.tabview.grid_propagate(False)
         
-        # Title
-        ctk.CTkLabel(comparison_frame, text="City Weather Comparison", 
-                    font=ctk.CTkFont(size=18, weight="bold")).pack(pady=(5, 5))
-        
-        # Input section
-        input_frame = ctk.CTkFrame(comparison_frame)
-        input_frame.pack(fill="x", padx=20, pady=(0, 15))
+        # Create tabs; their contents are built on first selection
+        for name in self._tab_specs:
+            self.widgets.tabview.add(name)
         
-        # Input container for side-by-side layout
-        input_container = ctk.CTkFrame(input_frame)
-        input_container.pack(pady=20)
-        
-        # City 1 input
-        city1_frame = ctk.CTkFrame(input_container)
-        city1_frame.pack(side="left", padx=(20, 10))
+        # Only the initially visible tab is built up front
+        self.ensure_tab(self.widgets.tabview.get())
+    
+    def _on_tab_selected(self):
+        """Build the newly selected tab's contents if this is its first showing"""
+        self.ensure_tab(self.widgets.tabview.get())
+    
+    def ensure_tab(self, name):
+        """
+        Build a feature tab's widgets if they have not been created yet
         
-        ctk.CTkLabel(city1_frame, text="City 1:", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 5))
-        self.widgets['city1_entry'] = ctk.CTkEntry(city1_frame, placeholder_text="Enter first city...", 
-                                       width=150, font=ctk.CTkFont(size=12))
-        self.widgets['city1_entry'].pack(padx=15, pady=(0, 5))
+        Args:
+            name (str): Tab name as shown in the tabview
+        """
+        if name in self._tab_built:
+            return
+        self._tab_built.add(name)
         
-        ctk.CTkLabel(city1_frame, text="State (optional):", 
-                    font=ctk.CTkFont(size=12)).pack(pady=(5, 2))
-        self.widgets['state1_entry'] = ctk.CTkEntry(city1_frame, placeholder_text="FL, California, etc.", 
-                                        width=150, font=ctk.CTkFont(size=12))
-        self.widgets['state1_entry'].pack(padx=15, pady=(0, 15))
+        # The tab is sized by the tabview, so its contents need not propagate
+        # their requested sizes back up through the layout
+        self.widgets.tabview.tab(name).pack_propagate(False)
+        self._build_tab(self._tab_specs[name])
         
-        # VS separator with compare button
-        vs_frame = ctk.CTkFrame(input_container)
-        vs_frame.pack(side="left", padx=10)
+        if self.on_tab_built is not None:
+            self.on_tab_built(name)
+    
+    def _build_tab(self, spec):
+        """Build a feature tab's contents from its TAB_SPECS entry"""
+        tab_frame = ctk.CTkFrame(self.widgets.tabview.tab(spec["name"]))
+        tab_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        ctk.CTkLabel(vs_frame, text="VS", 
-                    font=ctk.CTkFont(size=20, weight="bold"),
-                    text_color="#5400D2").pack(padx=20, pady=(30, 10))
+        # Title
+        if "title" in spec:
+            self._title(tab_frame, spec["title"], 18).pack(pady=spec["title_pady"])
         
-        # Compare button in the VS section
-        self.widgets['compare_btn'] = ctk.CTkButton(vs_frame, text="🔄 Compare", 
-                                   width=140, height=36, font=ctk.CTkFont(size=14, weight="bold"))
-        self.widgets['compare_btn'].pack(padx=20, pady=(10, 30))
+        # Tab-specific controls
+        getattr(self, spec["section"])(tab_frame)
         
-        # City 2 input
-        city2_frame = ctk.CTkFrame(input_container)
-        city2_frame.pack(side="left", padx=(10, 20))
+        # Results section
+        results_frame = tab_frame
+        if "results" in spec:
+            results_frame = ctk.CTkFrame(tab_frame)
+            results_frame.pack(fill="both", expand=True, padx=20, pady=spec["results_pady"])
+            
+            self._title(results_frame, spec["results"], 14).pack(pady=(15, 10))
+        
+        # Results display; static initial text starts out in a lightweight label.
+        # Results are only ever replaced wholesale, so no undo history is kept
+        options = {"undo": False, "autoseparators": False}
+        if "font_size" in spec:
+            options["font"] = self._f(spec["font_size"])
+        if "textbox_height" in spec:
+            options["height"] = spec["textbox_height"]
+        if "initial" in spec:
+            textbox = PlaceholderTextbox(results_frame, spec["initial"], **options)
+        else:
+            textbox = ctk.CTkTextbox(results_frame, **options)
+            textbox.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        if "textbox" in spec:
+            setattr(self.widgets, spec["textbox"], textbox)
+    
+    def _create_comparison_inputs(self, comparison_frame):
+        """Create the city comparison inputs"""
+        # Input section: city 1 | VS + compare | city 2, laid out on one grid
+        input_frame = ctk.CTkFrame(comparison_frame)
+        input_frame.pack(fill="x", padx=20, pady=(0, 15))
+        self._center_grid_columns(input_frame, 3)
         
-        ctk.CTkLabel(city2_frame, text="City 2:", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 5))
-        self.widgets['city2_entry'] = ctk.CTkEntry(city2_frame, placeholder_text="Enter second city...", 
-                                       width=150, font=ctk.CTkFont(size=12))
-        self.widgets['city2_entry'].pack(padx=15, pady=(0, 5))
+        # City 1 input
+        ctk.CTkLabel(input_frame, text="City 1:", 
+                    font=self._f(14, "bold")).grid(row=0, column=1, pady=(20, 5))
+        self.widgets.city1_entry = ctk.CTkEntry(input_frame, placeholder_text=_PH_CITY1, 
+                                       width=150, font=self._f(12))
+        self.widgets.city1_entry.grid(row=1, column=1, padx=(20, 15), pady=(0, 5))
+        
+        ctk.CTkLabel(input_frame, text="State (optional):", 
+                    font=self._f(12)).grid(row=2, column=1, pady=(5, 2))
+        self.widgets.state1_entry = ctk.CTkEntry(input_frame, placeholder_text=_PH_STATE1, 
+                                        width=150, font=self._f(12))
+        self.widgets.state1_entry.grid(row=3, column=1, padx=(20, 15), pady=(0, 20))
         
-        ctk.CTkLabel(city2_frame, text="State (optional):", 
-                    font=ctk.CTkFont(size=12)).pack(pady=(5, 2))
-        self.widgets['state2_entry'] = ctk.CTkEntry(city2_frame, placeholder_text="TX, New York, etc.", 
-                                        width=150, font=ctk.CTkFont(size=12))
-        self.widgets['state2_entry'].pack(padx=15, pady=(0, 15))
+        # VS separator with compare button
+        ctk.CTkLabel(input_frame, text="VS", 
+                    font=self._f(20, "bold"),
+                    text_color=PALETTE["accent"]).grid(row=0, column=2, rowspan=2, padx=20, pady=(20, 5))
         
-        # Results section
-        results_frame = ctk.CTkFrame(comparison_frame)
-        results_frame.pack(fill="both", expand=True, padx=20, pady=(5, 5))
+        self.widgets.compare_btn = ctk.CTkButton(input_frame, text=_BTN_COMPARE, 
+                                   width=140, height=36, font=self._f(14, "bold"))
+        self.widgets.compare_btn.grid(row=2, column=2, rowspan=2, padx=20, pady=(5, 20))
         
-        ctk.CTkLabel(results_frame, text="Comparison Results", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 10))
+        # City 2 input
+        ctk.CTkLabel(input_frame, text="City 2:", 
+                    font=self._f(14, "bold")).grid(row=0, column=3, pady=(20, 5))
+        self.widgets.city2_entry = ctk.CTkEntry(input_frame, placeholder_text=_PH_CITY2, 
+                                       width=150, font=self._f(12))
+        self.widgets.city2_entry.grid(row=1, column=3, padx=(15, 20), pady=(0, 5))
+        
+        ctk.CTkLabel(input_frame, text="State (optional):", 
+                    font=self._f(12)).grid(row=2, column=3, pady=(5, 2))
+        self.widgets.state2_entry = ctk.CTkEntry(input_frame, placeholder_text=_PH_STATE2, 
+                                        width=150, font=self._f(12))
+        self.widgets.state2_entry.grid(row=3, column=3, padx=(15, 20), pady=(0, 20))
         
-        # Results display
-        self.widgets['comparison_textbox'] = ctk.CTkTextbox(results_frame, font=ctk.CTkFont(size=12))
-        self.widgets['comparison_textbox'].pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        self.widgets['comparison_textbox'].insert("0.0", "Enter two cities above and click 'Compare Cities' to see detailed weather comparison.")
     
-    def _create_forecast_tab(self):
-        """Create the weather forecast interface"""
-        parent = self.widgets['tabview'].tab("Weather Forecast")
-        forecast_frame = ctk.CTkFrame(parent)
-        forecast_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        # Title
-        ctk.CTkLabel(forecast_frame, text="Weather Forecast", 
-                    font=ctk.CTkFont(size=18, weight="bold")).pack(pady=(10, 15))
-        
-        # Input section
+    def _create_forecast_inputs(self, forecast_frame):
+        """Create the forecast inputs"""
+        # Input section, laid out as a single grid row
         input_frame = ctk.CTkFrame(forecast_frame)
         input_frame.pack(fill="x", padx=20, pady=(0, 15))
-        
-        input_container = ctk.CTkFrame(input_frame)
-        input_container.pack(pady=15)
+        self._center_grid_columns(input_frame, 5)
         
         # City input
-        ctk.CTkLabel(input_container, text="City:", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(side="left", padx=(20, 10))
+        ctk.CTkLabel(input_frame, text="City:", 
+                    font=self._f(14, "bold")).grid(row=0, column=1, padx=(20, 10), pady=15)
         
-        self.widgets['forecast_city_entry'] = ctk.CTkEntry(input_container, placeholder_text="Enter city name...", 
-                                              width=200, font=ctk.CTkFont(size=14))
-        self.widgets['forecast_city_entry'].pack(side="left", padx=(0, 10))
+        self.widgets.forecast_city_entry = ctk.CTkEntry(input_frame, placeholder_text=_PH_CITY, 
+                                              width=200, font=self._f(14))
+        self.widgets.forecast_city_entry.grid(row=0, column=2, padx=(0, 10), pady=15)
         
         # State input (optional)
-        ctk.CTkLabel(input_container, text="State:", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(side="left", padx=(10, 5))
-        
-        self.widgets['forecast_state_entry'] = ctk.CTkEntry(input_container, placeholder_text="Optional (CA, Texas, FL, etc.)", 
-                                               width=150, font=ctk.CTkFont(size=14))
-        self.widgets['forecast_state_entry'].pack(side="left", padx=(0, 15))
+        ctk.CTkLabel(input_frame, text="State:", 
+                    font=self._f(14, "bold")).grid(row=0, column=3, padx=(10, 5), pady=15)
         
-        # Buttons container
-        button_frame = ctk.CTkFrame(input_container)
-        button_frame.pack(side="left", padx=(15, 20))
+        self.widgets.forecast_state_entry = ctk.CTkEntry(input_frame, placeholder_text=_PH_STATE_OPT2, 
+                                               width=150, font=self._f(14))
+        self.widgets.forecast_state_entry.grid(row=0, column=4, padx=(0, 15), pady=15)
         
-        # Forecast buttons
-        self.widgets['forecast_btn'] = ctk.CTkButton(button_frame, text="📅 5-Day Forecast", 
-                                   width=140, height=32, font=ctk.CTkFont(size=13, weight="bold"))
-        self.widgets['forecast_btn'].pack(side="left")
-        
-        # Results section
-        results_frame = ctk.CTkFrame(forecast_frame)
-        results_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        
-        ctk.CTkLabel(results_frame, text="Forecast Results", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 10))
-        
-        # Results display
-        self.widgets['forecast_textbox'] = ctk.CTkTextbox(results_frame, font=ctk.CTkFont(size=11))
-        self.widgets['forecast_textbox'].pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        self.widgets['forecast_textbox'].insert("0.0", "Enter a city name (and optional state) above and click:\n• '5-Day Forecast' for detailed weather predictions\n• 'Weather Trends' for analysis\n• 'Accuracy Report' to see how accurate our past forecasts were\n\nTip: Add state (e.g., CA, TX) to distinguish between cities with the same name")
+        # Forecast button
+        self.widgets.forecast_btn = ctk.CTkButton(input_frame, text=_BTN_FORECAST, 
+                                   width=140, height=32, font=self._f(13, "bold"))
+        self.widgets.forecast_btn.grid(row=0, column=5, padx=(15, 20), pady=15)
     
-    def _create_history_tab(self):
-        """Create the weather history interface"""
-        parent = self.widgets['tabview'].tab("Weather History")
-        history_frame = ctk.CTkFrame(parent)
-        history_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
+    def _create_history_header(self, history_frame):
+        """Create the history header with its title and view buttons"""
         # Header with title and controls
         header_frame = ctk.CTkFrame(history_frame)
         header_frame.pack(fill="x", padx=20, pady=(20, 10))
         
-        ctk.CTkLabel(header_frame, text="Weather History", 
-                    font=ctk.CTkFont(size=18, weight="bold")).pack(side="left", pady=10)
+        self._title(header_frame, "Weather History", 18).pack(side="left", pady=10)
         
         # Buttons for different views
-        button_frame = ctk.CTkFrame(header_frame)
+        button_frame = self._plain_frame(header_frame)
         button_frame.pack(side="right", pady=10)
         
-        self.widgets['recent_btn'] = ctk.CTkButton(button_frame, text="📈 Recent", 
-                                  width=100, height=32, font=ctk.CTkFont(size=12, weight="bold"))
-        self.widgets['recent_btn'].pack(side="left", padx=(0, 10))
+        self.widgets.recent_btn = ctk.CTkButton(button_frame, text=_BTN_RECENT, 
+                                  width=100, height=32, font=self._f(12, "bold"))
+        self.widgets.recent_btn.pack(side="left", padx=(0, 10))
         
-        self.widgets['stats_btn'] = ctk.CTkButton(button_frame, text="📊 Statistics", 
-                                 width=100, height=32, font=ctk.CTkFont(size=12, weight="bold"))
-        self.widgets['stats_btn'].pack(side="left")
-        
-        # History display
-        self.widgets['history_textbox'] = ctk.CTkTextbox(history_frame, font=ctk.CTkFont(size=12))
-        self.widgets['history_textbox'].pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.widgets.stats_btn = ctk.CTkButton(button_frame, text=_BTN_STATS, 
+                                 width=100, height=32, font=self._f(12, "bold"))
+        self.widgets.stats_btn.pack(side="left")
     
-    def _create_settings_tab(self):
-        """Create the settings interface"""
-        parent = self.widgets['tabview'].tab("Settings & Preferences")
-        settings_frame = ctk.CTkFrame(parent)
-        settings_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        # Settings title
-        ctk.CTkLabel(settings_frame, text="Settings & Preferences", 
-                    font=ctk.CTkFont(size=18, weight="bold")).pack(pady=(20, 15))
-        
+    def _create_settings_sections(self, settings_frame):
+        """Create the settings controls"""
         # Settings content
-        content_frame = ctk.CTkFrame(settings_frame)
+        content_frame = self._plain_frame(settings_frame)
         content_frame.pack(fill="x", padx=20, pady=10)
         
         # Save preferences section
         save_section = ctk.CTkFrame(content_frame)
         save_section.pack(fill="x", padx=20, pady=20)
         
-        ctk.CTkLabel(save_section, text="Save Your Preferences", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 10))
+        self._title(save_section, "Save Your Preferences", 14).pack(pady=(15, 10))
         
         ctk.CTkLabel(save_section, text="Click below to save your current theme and default city settings.",
-                    font=ctk.CTkFont(size=12)).pack(pady=(0, 10))
-        
-        self.widgets['save_btn'] = ctk.CTkButton(save_section, text="💾 Save Settings", 
-                                width=180, height=36, font=ctk.CTkFont(size=14, weight="bold"))
-        self.widgets['save_btn'].pack(pady=(10, 20))
+                    font=self._f(12)).pack(pady=(0, 10))
         
-        # Info section
-        info_frame = ctk.CTkFrame(settings_frame)
-        info_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        
-        ctk.CTkLabel(info_frame, text="Application Info", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 10))
-        
-        info_text = ctk.CTkTextbox(info_frame, height=100)
-        info_text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        info_text.insert("0.0", "WeatherCap Dashboard v1.0\n\n• Real-time weather data\n• City comparison features\n• Dark/Light theme support\n• Weather history tracking\n• User preference persistence")
+        self.widgets.save_btn = ctk.CTkButton(save_section, text=_BTN_SAVE, 
+                                width=180, height=36, font=self._f(14, "bold"))
+        self.widgets.save_btn.pack(pady=(10, 20))
     
     def _create_status_bar(self):
         """Create the status bar"""
-        self.widgets['status_frame'] = ctk.CTkFrame(self.widgets['main_frame'])
-        self.widgets['status_frame'].pack(fill="x", padx=10, pady=(10, 0))
-        
-        self.widgets['status_label'] = ctk.CTkLabel(self.widgets['status_frame'], text="Ready", 
-                                        font=ctk.CTkFont(size=12))
-        self.widgets['status_label'].pack(pady=8, padx=15, anchor="w")
-    
-    def _create_group_feature_tab(self):
-        """Create the group collaboration feature interface with CSV comparison and live weather data"""
-        parent = self.widgets['tabview'].tab("Group Feature")
-        group_frame = ctk.CTkFrame(parent)
-        group_frame.pack(fill="both", expand=True, padx=20, pady=20)
-
-        # Title
-        ctk.CTkLabel(group_frame, text="Temperature Comparison", 
-                    font=ctk.CTkFont(size=18, weight="bold")).pack(pady=(10, 15))
-        
+        # Fixed to the label's height plus padding
+        self.widgets.status_frame = ctk.CTkFrame(self.widgets.main_frame, height=44)
+        self.widgets.status_frame.pack(fill="x", padx=10, pady=(10, 0))
+        self.widgets.status_frame.pack_propagate(False)
+        
+        self.widgets.status_label = ctk.CTkLabel(self.widgets.status_frame, text="Ready", 
+                                        font=self._f(12))
+        self.widgets.status_label.pack(pady=8, padx=15, anchor="w")
+    
+    def _create_group_sections(self, group_frame):
+        """Create the group feature's CSV comparison and file controls"""
         # Description
         description_frame = ctk.CTkFrame(group_frame)
         description_frame.pack(fill="x", padx=20, pady=(0, 15))
@@ -439,123 +559,119 @@ class WeatherGUIComponents:
         description_text = ("Compare historical CSV temperature data with recent temperature trends!\n"
                           "Load multiple CSV files and compare with recent temperature data.")
         ctk.CTkLabel(description_frame, text=description_text, 
-                    font=ctk.CTkFont(size=12), wraplength=450).pack(pady=15, padx=20)
+                    font=self._f(12), wraplength=450).pack(pady=15, padx=20)
         
         # Main control section
         control_section = ctk.CTkFrame(group_frame)
         control_section.pack(fill="x", padx=20, pady=(0, 15))
         
-        ctk.CTkLabel(control_section, text="Temperature Data Comparison", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 10))
+        self._center_grid_columns(control_section, 2)
         
-        # Control buttons frame
-        buttons_frame = ctk.CTkFrame(control_section)
-        buttons_frame.pack(pady=(0, 15))
+        self._title(control_section, "Temperature Data Comparison", 14).grid(row=0, column=0, columnspan=4, pady=(15, 10))
         
         # CSV Comparison button
-        self.widgets['csv_comparison_btn'] = ctk.CTkButton(
-            buttons_frame, 
-            text="� CSV Comparison Only", 
+        self.widgets.csv_comparison_btn = ctk.CTkButton(
+            control_section, 
+            text=_BTN_CSV_ONLY, 
             width=160, height=36, 
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._f(12, "bold")
         )
-        self.widgets['csv_comparison_btn'].pack(side="left", padx=(20, 10), pady=10)
+        self.widgets.csv_comparison_btn.grid(row=1, column=1, padx=(20, 10), pady=(10, 25))
         
         # Live + CSV Comparison button
-        self.widgets['live_csv_comparison_btn'] = ctk.CTkButton(
-            buttons_frame, 
-            text="�️ CSV + Recent Temps", 
+        self.widgets.live_csv_comparison_btn = ctk.CTkButton(
+            control_section, 
+            text=_BTN_CSV_RECENT, 
             width=180, height=36, 
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._f(12, "bold")
         )
-        self.widgets['live_csv_comparison_btn'].pack(side="left", padx=(0, 20), pady=10)
+        self.widgets.live_csv_comparison_btn.grid(row=1, column=2, padx=(0, 20), pady=(10, 25))
         
         # Live cities configuration section
         config_section = ctk.CTkFrame(group_frame)
         config_section.pack(fill="x", padx=20, pady=(0, 15))
         
-        ctk.CTkLabel(config_section, text="Temperature Cities", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 10))
+        self._title(config_section, "Temperature Cities", 14).pack(pady=(15, 10))
         
         # Cities input
-        cities_input_frame = ctk.CTkFrame(config_section)
+        cities_input_frame = self._plain_frame(config_section)
         cities_input_frame.pack(pady=(0, 15))
         
         ctk.CTkLabel(cities_input_frame, text="Cities for temperature data (comma-separated):", 
-                    font=ctk.CTkFont(size=12)).pack(pady=(10, 5))
+                    font=self._f(12)).pack(pady=(10, 5))
         
-        self.widgets['live_cities_entry'] = ctk.CTkEntry(
+        self.widgets.live_cities_entry = ctk.CTkEntry(
             cities_input_frame, 
-            placeholder_text="Toronto, Lincoln, Rockland, Los Angeles", 
+            placeholder_text=_PH_LIVE_CITIES, 
             width=400, 
-            font=ctk.CTkFont(size=12)
+            font=self._f(12)
         )
-        self.widgets['live_cities_entry'].pack(padx=20, pady=(0, 5))
+        self.widgets.live_cities_entry.pack(padx=20, pady=(0, 5))
         
         # Add note about zip codes
         ctk.CTkLabel(cities_input_frame, text="Note: Zip codes are not allowed - use city names only", 
-                    font=ctk.CTkFont(size=10, slant="italic"), 
-                    text_color="gray").pack(pady=(0, 15))
+                    font=self._f(10, slant="italic"), 
+                    text_color=PALETTE["note"]).pack(pady=(0, 15))
         
         # File selection section
         file_section = ctk.CTkFrame(group_frame)
         file_section.pack(fill="x", padx=20, pady=(0, 15))
         
-        ctk.CTkLabel(file_section, text="CSV Files Management", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 10))
+        self._center_grid_columns(file_section, 3)
         
-        file_buttons_frame = ctk.CTkFrame(file_section)
-        file_buttons_frame.pack(pady=(0, 15))
+        self._title(file_section, "CSV Files Management", 14).grid(row=0, column=0, columnspan=5, pady=(15, 10))
         
-        self.widgets['browse_csv_btn'] = ctk.CTkButton(
-            file_buttons_frame, 
-            text="📂 Browse CSV Files", 
+        self.widgets.browse_csv_btn = ctk.CTkButton(
+            file_section, 
+            text=_BTN_BROWSE, 
             width=140, height=36, 
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._f(12, "bold")
         )
-        self.widgets['browse_csv_btn'].pack(side="left", padx=(20, 10), pady=10)
+        self.widgets.browse_csv_btn.grid(row=1, column=1, padx=(20, 10), pady=(10, 25))
         
-        self.widgets['use_default_csv_btn'] = ctk.CTkButton(
-            file_buttons_frame, 
-            text="📋 Use Group CSVs", 
+        self.widgets.use_default_csv_btn = ctk.CTkButton(
+            file_section, 
+            text=_BTN_GROUP_CSVS, 
             width=140, height=36, 
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._f(12, "bold")
         )
-        self.widgets['use_default_csv_btn'].pack(side="left", padx=(0, 10), pady=10)
+        self.widgets.use_default_csv_btn.grid(row=1, column=2, padx=(0, 10), pady=(10, 25))
         
-        self.widgets['auto_detect_csv_btn'] = ctk.CTkButton(
-            file_buttons_frame, 
-            text="🔍 Auto-Detect CSVs", 
+        self.widgets.auto_detect_csv_btn = ctk.CTkButton(
+            file_section, 
+            text=_BTN_AUTO_DETECT, 
             width=140, height=36, 
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._f(12, "bold")
         )
-        self.widgets['auto_detect_csv_btn'].pack(side="left", padx=(0, 20), pady=10)
-        
-        # Results/Display Section
-        results_section = ctk.CTkFrame(group_frame)
-        results_section.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        
-        ctk.CTkLabel(results_section, text="Results & Status", 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 10))
-        
-        # Display area for results
-        self.widgets['group_textbox'] = ctk.CTkTextbox(results_section, font=ctk.CTkFont(size=11))
-        self.widgets['group_textbox'].pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        
-        # Initial message
-        initial_message = ("🌤️ Advanced Weather Comparison Tools\n\n"
-                          "� CSV Comparison Only: Compare historical data from multiple CSV files\n"
-                          "🌐 CSV + Live Weather: Combine historical data with current weather conditions\n"
-                          "🎬 Run Demo: See a demonstration with sample data\n\n"
-                          "Instructions:\n"
-                          "1. Enter cities for live weather data (optional)\n"
-                          "2. Choose CSV files or use default group CSVs\n"
-                          "3. Click a comparison button to generate graphs\n\n"
-                          "Supported CSV format: Date, Time, City, Temperature_F\n"
-                          "Generated plots will be saved in the WeatherCap directory.")
-        self.widgets['group_textbox'].insert("0.0", initial_message)
-
-
+        self.widgets.auto_detect_csv_btn.grid(row=1, column=3, padx=(0, 20), pady=(10, 25))
+    
+    def _f(self, size, weight="normal", slant="roman"):
+        """Get a shared CTkFont, creating it the first time it is needed"""
+        key = (size, weight, slant)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(size=size, weight=weight, slant=slant)
+        return font
+    
+    def _title(self, parent, text, size):
+        """Create a bold section title label (the caller packs or grids it)"""
+        return ctk.CTkLabel(parent, text=text, font=self._f(size, "bold"))
+    
+    def _plain_frame(self, master):
+        """
+        Create a frame used only for layout, with no background or rounded
+        corners for CustomTkinter to draw
+        """
+        return ctk.CTkFrame(master, fg_color="transparent", corner_radius=0)
+    
+    def _center_grid_columns(self, frame, columns):
+        """
+        Give a grid's outer spacer columns the spare width so the cells in
+        columns 1..columns stay centered
+        """
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_columnconfigure(columns + 1, weight=1)
+    
     def get_widget(self, widget_name):
         """Get a specific widget by name"""
         return self.widgets.get(widget_name)
@@ -2,7 +2,26 @@
 Utils Package - Contains utility functions and managers
 """
 
-from .preferences_manager import PreferencesManager, ThemeManager
-from .state_validator import StateValidator
+# Submodules are imported on first attribute access (PEP 562) so importing
+# one utility doesn't pull in the others
+_EXPORTS = {
+    'PreferencesManager': 'preferences_manager',
+    'ThemeManager': 'preferences_manager',
+    'StateValidator': 'state_validator',
+}
 
-__all__ = ['PreferencesManager', 'ThemeManager', 'StateValidator']
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
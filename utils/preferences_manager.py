@@ -4,17 +4,72 @@ Separates preference logic from GUI and application controller
 """
 
 import json
+import mmap
 import os
-from tkinter import messagebox
+from types import MappingProxyType
 from config import DEFAULT_THEME, DEFAULT_CITY
 
+__all__ = ['PreferencesManager', 'ThemeManager']
+
+# msgspec is optional; preferences are stored as MessagePack when it is
+# installed and fall back to the stdlib json module without it
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# customtkinter is imported by the first ThemeManager.apply_theme call
+ctk = None
+
+JSON_PREFS_FILE = "data/user_preferences.json"
+MSGPACK_PREFS_FILE = "data/user_preferences.mpack"
+
+if msgspec is not None:
+    class Prefs(msgspec.Struct):
+        """On-disk preferences schema; missing fields take the app defaults"""
+        theme: str = DEFAULT_THEME
+        default_city: str = DEFAULT_CITY
+    
+    _prefs_encoder = msgspec.msgpack.Encoder()
+    _prefs_decoder = msgspec.msgpack.Decoder(Prefs)
+
+# Parsed preferences per file, reused while the file's mtime is unchanged:
+# path -> (mtime_ns, prefs)
+_prefs_cache = {}
+
+
+def _write_file_atomic(path, data):
+    """
+    Replace a file's contents with data in one write
+    
+    The bytes go to a temporary file next to the target, which is then
+    renamed over it, so a crash mid-save never leaves a half-written file.
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        os.remove(tmp_path)
+        raise
+
 
 class PreferencesManager:
     """Manages user preferences persistence and theme management"""
     
+    __slots__ = ('prefs_file', 'preferences', '_saved_prefs')
+    
     def __init__(self):
         """Initialize preferences manager"""
-        self.prefs_file = "data/user_preferences.json"
+        self.prefs_file = MSGPACK_PREFS_FILE if msgspec is not None else JSON_PREFS_FILE
+        self._saved_prefs = None  # What is currently on disk, if known
         self.preferences = self.load_preferences()
         
     def load_preferences(self):
@@ -31,14 +86,45 @@ class PreferencesManager:
         
         try:
             if os.path.exists(self.prefs_file):
-                with open(self.prefs_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                mtime_ns = os.stat(self.prefs_file).st_mtime_ns
+                cached = _prefs_cache.get(self.prefs_file)
+                if cached is not None and cached[0] == mtime_ns:
+                    self._saved_prefs = cached[1]
+                    return dict(cached[1])
+                
+                with open(self.prefs_file, "rb") as f:
+                    if msgspec is not None:
+                        # msgspec decodes straight from the mapped file, no read() copy
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            prefs = msgspec.structs.asdict(_prefs_decoder.decode(mm))
+                    else:
+                        prefs = json.loads(f.read())
+                self._saved_prefs = dict(prefs)
+                _prefs_cache[self.prefs_file] = (mtime_ns, self._saved_prefs)
+                return prefs
+            elif self.prefs_file != JSON_PREFS_FILE and os.path.exists(JSON_PREFS_FILE):
+                return self._migrate_json_preferences()
             else:
                 return default_prefs
         except Exception as e:
             print(f"Error loading preferences: {e}")
             return default_prefs
     
+    def _migrate_json_preferences(self):
+        """
+        Copy preferences saved by older versions as JSON into the MessagePack file
+        
+        The JSON file is left in place so it still applies if msgspec is
+        ever uninstalled.
+        
+        Returns:
+            dict: The migrated preferences
+        """
+        with open(JSON_PREFS_FILE, "rb") as f:
+            prefs = msgspec.structs.asdict(msgspec.json.decode(f.read(), type=Prefs))
+        self.save_preferences(prefs['theme'], prefs['default_city'])
+        return prefs
+    
     def save_preferences(self, theme, default_city):
         """
         Save user preferences to file
@@ -48,10 +134,20 @@ class PreferencesManager:
             'default_city': default_city
         }
         
+        # Nothing to write if the file already holds these values
+        if prefs == self._saved_prefs:
+            self.preferences = prefs
+            return True
+        
         try:
             os.makedirs(os.path.dirname(self.prefs_file), exist_ok=True)
-            with open(self.prefs_file, "w", encoding="utf-8") as f:
-                json.dump(prefs, f, indent=2)
+            if msgspec is not None:
+                data = _prefs_encoder.encode(Prefs(theme, default_city))
+            else:
+                data = json.dumps(prefs, indent=2).encode("utf-8")
+            _write_file_atomic(self.prefs_file, data)
+            self._saved_prefs = dict(prefs)
+            _prefs_cache[self.prefs_file] = (os.stat(self.prefs_file).st_mtime_ns, self._saved_prefs)
             
             # Update internal preferences
             self.preferences = prefs
@@ -76,13 +172,18 @@ class PreferencesManager:
     def get_all_preferences(self):
         """
         Get all current preferences
+        
+        Returns:
+            Mapping: Read-only live view; use dict(...) for a mutable copy
         """
-        return self.preferences.copy()
+        return MappingProxyType(self.preferences)
 
 
 class ThemeManager:
     """Manages application theme changes and persistence"""
     
+    __slots__ = ('current_theme',)
+    
     def __init__(self, initial_theme='light'):
         """
         Initialize theme manager
@@ -93,14 +194,14 @@ class ThemeManager:
         """
         Apply the specified theme to the application
         """
-        import customtkinter as ctk
+        global ctk
+        if ctk is None:
+            import customtkinter
+            ctk = customtkinter
         
-        if theme == "dark":
-            ctk.set_appearance_mode("dark")
-            self.current_theme = 'dark'
-        else:
-            ctk.set_appearance_mode("light")
-            self.current_theme = 'light'
+        mode = 'dark' if theme == "dark" else 'light'
+        ctk.set_appearance_mode(mode)
+        self.current_theme = mode
     
     def toggle_theme(self):
         """
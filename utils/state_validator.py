@@ -2,6 +2,10 @@
 State Validation Utility - Validates US state names and abbreviations
 """
 
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+
 # US State abbreviations and full names mapping
 US_STATES = {
     # Standard state abbreviations
@@ -21,8 +25,10 @@ US_STATES = {
     'AS': 'American Samoa', 'GU': 'Guam', 'MP': 'Northern Mariana Islands'
 }
 
-# Create reverse mapping for full names
-FULL_NAME_TO_ABBREV = {full_name.upper(): abbrev for abbrev, full_name in US_STATES.items()}
+# Error-message summary of valid states; US_STATES never changes, so build it once
+_FORMATTED_STATE_LIST = ("Valid states include: "
+                         + ", ".join(f"{abbrev} ({full_name})" for abbrev, full_name in sorted(US_STATES.items())[:10])
+                         + "... (and 40+ more)")
 
 # Common state name variations and misspellings
 STATE_ALIASES = {
@@ -46,14 +52,148 @@ STATE_ALIASES = {
 }
 
 
+def _build_normalize_table():
+    """
+    Map every recognized spelling (abbreviation, alias or upper-cased full
+    name) to its abbreviation
+    
+    Abbreviations take precedence over aliases and aliases over full names,
+    matching the order they used to be checked in. Keys and values are
+    interned so every returned abbreviation is one shared object.
+    """
+    table = {full_name.upper(): abbrev for abbrev, full_name in US_STATES.items()}
+    table.update(STATE_ALIASES)
+    table.update((abbrev, abbrev) for abbrev in US_STATES)
+    return {sys.intern(name): sys.intern(abbrev) for name, abbrev in table.items()}
+
+
+_NORMALIZE = _build_normalize_table()
+
+
+def _build_abbrev_prefix_index():
+    """
+    Map abbreviation prefixes to suggestion strings
+    
+    Keys are every abbreviation plus every abbreviation's first letter, so
+    looking up the first two characters of an input (or its only character)
+    finds the abbreviation it starts with. The first state in table order
+    wins for a shared first letter.
+    """
+    index = {}
+    for abbrev, full_name in US_STATES.items():
+        suggestion = f"{abbrev} ({full_name})"
+        index.setdefault(abbrev, suggestion)
+        index.setdefault(abbrev[0], suggestion)
+    return index
+
+
+_ABBREV_PREFIX_INDEX = _build_abbrev_prefix_index()
+
+# (upper-cased name, suggestion) pairs for the substring passes, in table order
+_STATES_UPPER = tuple((full_name.upper(), f"{abbrev} ({full_name})")
+                      for abbrev, full_name in US_STATES.items())
+_ALIASES_UPPER = tuple((alias, f"{abbrev} ({US_STATES[abbrev]})")
+                       for alias, abbrev in STATE_ALIASES.items())
+
+
+class _SubstringIndex:
+    """
+    Finds the first of a list of names containing a given text
+    
+    The names are joined into one NUL-separated string so a single C-level
+    str.find replaces a Python loop of `in` tests; the match offset is mapped
+    back to its name with a binary search over the names' start offsets.
+    """
+    
+    __slots__ = ('_suggestions', '_starts', '_text')
+    
+    _SEPARATOR = "\0"
+    
+    def __init__(self, entries):
+        """
+        Args:
+            entries: (name, suggestion) pairs, searched in order
+        """
+        self._suggestions = [suggestion for _, suggestion in entries]
+        self._starts = []
+        offset = 0
+        for name, _ in entries:
+            self._starts.append(offset)
+            offset += len(name) + len(self._SEPARATOR)
+        self._text = self._SEPARATOR.join(name for name, _ in entries)
+    
+    def first_containing(self, text):
+        """Suggestion for the first name containing text, or None"""
+        if self._SEPARATOR in text:
+            return None  # Names never contain the separator
+        pos = self._text.find(text)
+        if pos < 0:
+            return None
+        return self._suggestions[bisect_right(self._starts, pos) - 1]
+
+
+_FULL_NAME_SEARCH = _SubstringIndex(_STATES_UPPER)
+_ALIAS_SEARCH = _SubstringIndex(_ALIASES_UPPER)
+
+
+@lru_cache(maxsize=256)
+def _validate_clean_state(clean_input):
+    """
+    Validate an already stripped and upper-cased state input
+    
+    Results are memoized since the same handful of states are entered
+    over and over during a session.
+    
+    Returns:
+        tuple: (is_valid, normalized_abbrev, suggestion)
+    """
+    # Abbreviations, aliases and full names in a single lookup
+    abbrev = _NORMALIZE.get(clean_input)
+    if abbrev is not None:
+        return True, abbrev, None
+    
+    # Try to find close matches for suggestions
+    suggestion = _closest_state_match(clean_input)
+    
+    return False, None, suggestion
+
+
+def _closest_state_match(invalid_input):
+    """
+    Find the closest matching state for suggestions
+    
+    Args:
+        invalid_input (str): The invalid state input
+        
+    Returns:
+        str: Suggested state name or None if no close match found
+    """
+    invalid_input = invalid_input.upper()
+    
+    # Check for partial matches in abbreviations
+    suggestion = _ABBREV_PREFIX_INDEX.get(invalid_input[:2])
+    if suggestion is not None:
+        return suggestion
+    
+    # Check for partial matches in full names (a name or word prefix is
+    # also a substring, so one containment test covers them all)
+    suggestion = _FULL_NAME_SEARCH.first_containing(invalid_input)
+    if suggestion is not None:
+        return suggestion
+    
+    # Check for partial matches in aliases
+    return _ALIAS_SEARCH.first_containing(invalid_input)
+
+
 class StateValidator:
     """Validates and normalizes US state names and abbreviations"""
     
+    __slots__ = ('valid_states', 'aliases')
+    
     def __init__(self):
         """Initialize the state validator"""
         self.valid_states = US_STATES
         self.aliases = STATE_ALIASES
-        self.full_names = FULL_NAME_TO_ABBREV
     
     def validate_state(self, state_input):
         """
@@ -65,25 +205,8 @@ class StateValidator:
         if not state_input or not state_input.strip():
             return True, None, None  # Empty state is allowed
         
-        # Clean and normalize input
-        clean_input = state_input.strip().upper()
-        
-        # Direct match with abbreviations
-        if clean_input in self.valid_states:
-            return True, clean_input, None
-        
-        # Check aliases and variations
-        if clean_input in self.aliases:
-            return True, self.aliases[clean_input], None
-        
-        # Check full names
-        if clean_input in self.full_names:
-            return True, self.full_names[clean_input], None
-        
-        # Try to find close matches for suggestions
-        suggestion = self._find_closest_match(clean_input)
-        
-        return False, None, suggestion
+        # Clean and normalize input, then use the memoized lookup
+        return _validate_clean_state(state_input.strip().upper())
     
     def _find_closest_match(self, invalid_input):
         """
@@ -95,26 +218,7 @@ class StateValidator:
         Returns:
             str: Suggested state name or None if no close match found
         """
-        invalid_input = invalid_input.upper()
-        
-        # Check for partial matches in abbreviations
-        for abbrev in self.valid_states:
-            if invalid_input.startswith(abbrev[:2]) or abbrev.startswith(invalid_input[:2]):
-                return f"{abbrev} ({self.valid_states[abbrev]})"
-        
-        # Check for partial matches in full names
-        for abbrev, full_name in self.valid_states.items():
-            if (invalid_input in full_name.upper() or 
-                full_name.upper().startswith(invalid_input) or
-                any(word.startswith(invalid_input) for word in full_name.upper().split())):
-                return f"{abbrev} ({full_name})"
-        
-        # Check for partial matches in aliases
-        for alias, abbrev in self.aliases.items():
-            if invalid_input in alias or alias.startswith(invalid_input):
-                return f"{abbrev} ({self.valid_states[abbrev]})"
-        
-        return None
+        return _closest_state_match(invalid_input)
     
     def get_state_full_name(self, state_abbrev):
         """
@@ -140,9 +244,4 @@ class StateValidator:
         Returns:
             str: Formatted string of valid states
         """
-        states_list = []
-        for abbrev, full_name in sorted(self.valid_states.items()):
-            states_list.append(f"{abbrev} ({full_name})")
-        
-        # Group by regions for better readability
-        return "Valid states include: " + ", ".join(states_list[:10]) + "... (and 40+ more)"
+        return _FORMATTED_STATE_LIST